@@ -12,9 +12,10 @@ import os
 import json
 import re
 import logging
+from itertools import islice
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 from dataclasses import dataclass, asdict
 import psutil
 
@@ -289,6 +290,7 @@ class AuthorshipTracker:
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.authorship_file = self.data_dir / 'authorship_data.json'
         self.authorship_data = self._load_authorship_data()
+        self._stats_cache = None  # (commit count, statistics)
     
     def _load_authorship_data(self) -> Dict[str, Any]:
         """Load authorship data from disk.
@@ -1005,76 +1007,93 @@ class AuthorshipTracker:
         self.authorship_data['commits'].append(commit_entry)
         self._save_authorship_data()
     
-    def query_by_agent(self, agent: str) -> List[Dict[str, Any]]:
+    def iter_commits(self, agent: str = None, ide: str = None,
+                     project: str = None) -> Iterator[Dict[str, Any]]:
+        """Iterate over stored commits matching all given filters.
+        
+        Args:
+            agent: Optional agent name to filter by
+            ide: Optional IDE name to filter by
+            project: Optional resolved project path to filter by
+            
+        Yields:
+            Matching commit entries, oldest first
+        """
+        for commit in self.authorship_data['commits']:
+            if agent is not None and commit.get('agent') != agent:
+                continue
+            if ide is not None and commit.get('ide') != ide:
+                continue
+            if project is not None and commit.get('project') != project:
+                continue
+            yield commit
+    
+    def query_by_agent(self, agent: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Query commits by agent.
         
         Args:
             agent: Agent name to filter by
+            limit: Stop after this many matches (all if None)
             
         Returns:
             List of matching commits
         """
-        return [
-            commit for commit in self.authorship_data['commits']
-            if commit.get('agent') == agent
-        ]
+        return list(islice(self.iter_commits(agent=agent), limit))
     
-    def query_by_ide(self, ide: str) -> List[Dict[str, Any]]:
+    def query_by_ide(self, ide: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Query commits by IDE.
         
         Args:
             ide: IDE name to filter by
+            limit: Stop after this many matches (all if None)
             
         Returns:
             List of matching commits
         """
-        return [
-            commit for commit in self.authorship_data['commits']
-            if commit.get('ide') == ide
-        ]
+        return list(islice(self.iter_commits(ide=ide), limit))
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get authorship statistics.
         
+        The result is cached until the number of stored commits changes.
+        
         Returns:
             Statistics dictionary
         """
         commits = self.authorship_data['commits']
         
-        stats = {
-            'total_commits': len(commits),
-            'by_agent': {},
-            'by_ide': {},
-            'by_environment': {},
-            'top_tools': {},
-            'top_skills': {},
-        }
+        if self._stats_cache is not None and self._stats_cache[0] == len(commits):
+            return self._stats_cache[1]
         
-        # Count by agent
-        for commit in commits:
-            agent = commit.get('agent', 'unknown')
-            stats['by_agent'][agent] = stats['by_agent'].get(agent, 0) + 1
+        by_agent = {}
+        by_ide = {}
+        by_environment = {}
+        top_tools = {}
+        top_skills = {}
         
-        # Count by IDE
+        # Count everything in a single pass over the commits
         for commit in commits:
+            agent = commit.get('agent', 'unknown')
+            by_agent[agent] = by_agent.get(agent, 0) + 1
             ide = commit.get('ide', 'unknown')
-            stats['by_ide'][ide] = stats['by_ide'].get(ide, 0) + 1
-        
-        # Count by environment
-        for commit in commits:
+            by_ide[ide] = by_ide.get(ide, 0) + 1
             env = commit.get('environment', 'unknown')
-            stats['by_environment'][env] = stats['by_environment'].get(env, 0) + 1
-        
-        # Count tools
-        for commit in commits:
+            by_environment[env] = by_environment.get(env, 0) + 1
             for tool in commit.get('tools', []):
-                stats['top_tools'][tool] = stats['top_tools'].get(tool, 0) + 1
-        
-        # Count skills
-        for commit in commits:
+                top_tools[tool] = top_tools.get(tool, 0) + 1
             for skill in commit.get('skills', []):
-                stats['top_skills'][skill] = stats['top_skills'].get(skill, 0) + 1
+                top_skills[skill] = top_skills.get(skill, 0) + 1
+        
+        stats = {
+            'total_commits': len(commits),
+            'by_agent': by_agent,
+            'by_ide': by_ide,
+            'by_environment': by_environment,
+            'top_tools': top_tools,
+            'top_skills': top_skills,
+        }
         
+        self._stats_cache = (len(commits), stats)
         return stats
     
     def track_git_commit(self, repo_path: Path, commit_sha: str) -> AuthorshipMetadata:
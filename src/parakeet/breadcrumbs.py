@@ -87,7 +87,7 @@ class BreadcrumbGenerator:
             
             # Get recent commits
             commits = []
-            for commit in list(repo.iter_commits(max_count=10)):
+            for commit in repo.iter_commits(max_count=10):
                 commits.append({
                     'sha': commit.hexsha[:8],
                     'message': commit.message.strip(),
@@ -1,6 +1,7 @@
 """Brilliant Budgies - AI-powered coding assistant that generates helpful ideas."""
 
 import json
+import heapq
 import random
 import hashlib
 from pathlib import Path
@@ -491,9 +492,8 @@ class BrilliantBudgies:
         Returns:
             List of recent ideas
         """
-        # Sort by timestamp and return most recent
-        sorted_ideas = sorted(self.ideas, key=lambda x: x['timestamp'], reverse=True)
-        return sorted_ideas[:limit]
+        # Most recent first, without sorting every idea
+        return heapq.nlargest(limit, self.ideas, key=lambda x: x['timestamp'])
 
     def create_implementation_task(self, idea: Dict[str, Any]) -> Dict[str, Any]:
         """Create an implementation task from a Brilliant Budgie idea.
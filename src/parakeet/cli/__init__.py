@@ -0,0 +1,57 @@
+"""Command-line interface for Friendly Parakeet.
+
+Commands live in ``parakeet.cli.commands`` and are only imported when they
+are invoked (or listed by ``--help``), so running one command never pays for
+building the others.
+"""
+
+import importlib
+
+import click
+
+
+# Command name -> "module:attribute" under parakeet.cli.commands
+COMMANDS = {
+    'scan': 'tracking:scan',
+    'breadcrumb': 'tracking:breadcrumb',
+    'dashboard': 'tracking:dashboard',
+    'status': 'tracking:status',
+    'config-set': 'settings:config_set',
+    'config-show': 'settings:config_show',
+    'maintain': 'maintenance:maintain',
+    'auto-commit': 'maintenance:auto_commit',
+    'auto-push': 'maintenance:auto_push',
+    'changelog': 'maintenance:changelog',
+    'time-report': 'maintenance:time_report',
+    'add-path': 'paths:add_path',
+    'remove-path': 'paths:remove_path',
+    'list-paths': 'paths:list_paths',
+    'setup': 'paths:setup',
+    'menubar': 'menubar:menubar',
+    'authorship': 'authorship:authorship',
+    'authorship-stats': 'authorship:authorship_stats',
+    'analyze-authorship': 'authorship:analyze_authorship',
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that imports a command's module only when it is needed."""
+
+    def list_commands(self, ctx):
+        """List eagerly registered and lazy command names."""
+        return sorted({*super().list_commands(ctx), *COMMANDS})
+
+    def get_command(self, ctx, cmd_name):
+        """Resolve a command, importing its module on first use."""
+        if cmd_name not in COMMANDS:
+            return super().get_command(ctx, cmd_name)
+        module_name, attr = COMMANDS[cmd_name].split(':')
+        module = importlib.import_module(f'{__name__}.commands.{module_name}')
+        return getattr(module, attr)
+
+
+@click.group(cls=LazyGroup)
+@click.version_option(version='0.1.0')
+def main():
+    """🦜 Friendly Parakeet - Your coding progress companion."""
+    pass
@@ -0,0 +1 @@
+"""CLI command modules, loaded on demand by ``parakeet.cli.LazyGroup``."""
@@ -0,0 +1,220 @@
+"""Code authorship commands."""
+
+import heapq
+from itertools import islice
+from operator import itemgetter
+from pathlib import Path
+
+import click
+
+from ..common import dump_json, get_parakeet
+
+
+# Icons shown next to commits, keyed by detected agent
+AGENT_ICONS = {
+    'claude': '🧠',
+    'claude_code': '🧠',
+    'github_copilot': '🤖',
+    'cursor_ai': '✨',
+    'windsurf_ai': '🌊',
+    'chatgpt': '💬',
+    'human': '👤',
+}
+UNKNOWN_AGENT_ICON = '❓'
+
+# Percentage bars for authorship stats, one block per 5%
+PERCENT_BARS = tuple('█' * i for i in range(21))
+
+
+_git = None
+
+
+def get_git():
+    """Import GitPython on first use and keep the module for later calls.
+
+    Returns:
+        The ``git`` module
+    """
+    global _git
+    if _git is None:
+        import git
+        _git = git
+    return _git
+
+
+@click.command()
+@click.argument('project_path', required=False)
+@click.option('--config', '-c', help='Path to config file')
+@click.option('--agent', '-a', help='Filter by agent name')
+@click.option('--ide', '-i', help='Filter by IDE name')
+@click.option('--limit', '-l', default=20, help='Number of commits to show')
+def authorship(project_path, config, agent, ide, limit):
+    """Show authorship metadata for commits."""
+    parakeet = get_parakeet(config)
+    
+    # If specific filters provided, use them
+    if agent:
+        click.echo(f"\n🤖 Commits by agent '{agent}':\n")
+    elif ide:
+        click.echo(f"\n💻 Commits using IDE '{ide}':\n")
+    else:
+        # Show all commits
+        click.echo(f"\n📝 Authorship Information:\n")
+    
+    # Filter by project_path if provided
+    if project_path:
+        project_path = str(Path(project_path).resolve())
+    
+    # Only the first `limit` matches are materialized; the rest are just counted
+    matches = parakeet.authorship_tracker.iter_commits(
+        agent=agent or None,
+        ide=None if agent else (ide or None),
+        project=project_path or None,
+    )
+    commits = list(islice(matches, limit))
+    remaining = sum(1 for _ in matches)
+    
+    if project_path and commits:
+        click.echo(f"Filtered by project: {project_path}\n")
+    
+    if not commits:
+        click.echo("No authorship data found. Run 'parakeet scan' to collect data.")
+        return
+    
+    # Show limited number of commits, written out in one go
+    lines = []
+    for commit in commits:
+        sha = commit.get('sha', 'unknown')
+        sha_short = sha[:8] if sha != 'unknown' else 'unknown'
+        agent_name = commit.get('agent', 'unknown')
+        ide_name = commit.get('ide', 'unknown')
+        env = commit.get('environment', 'unknown')
+        tools = ', '.join(commit.get('tools', [])[:3]) or 'none'
+        skills = ', '.join(commit.get('skills', [])[:3]) or 'none'
+        confidence = commit.get('confidence', 0.0)
+        
+        # Color code by agent
+        agent_icon = AGENT_ICONS.get(agent_name, UNKNOWN_AGENT_ICON)
+        
+        lines.append(f"{agent_icon} {sha_short} | Agent: {agent_name} | IDE: {ide_name}")
+        lines.append(f"  Environment: {env} | Confidence: {confidence:.0%}")
+        lines.append(f"  Tools: {tools} | Skills: {skills}")
+        lines.append('')
+    
+    if remaining:
+        lines.append(f"... and {remaining} more commits")
+        lines.append(f"Use --limit to see more results")
+    
+    click.echo('\n'.join(lines))
+
+
+@click.command()
+@click.option('--config', '-c', help='Path to config file')
+@click.option('--format', '-f', type=click.Choice(['text', 'json']), default='text')
+def authorship_stats(config, format):
+    """Show statistics about code authorship."""
+    parakeet = get_parakeet(config)
+    
+    stats = parakeet.authorship_tracker.get_statistics()
+    
+    if format == 'json':
+        click.echo(dump_json(stats))
+        return
+    
+    # Text format
+    lines = []
+    lines.append("\n📊 Authorship Statistics\n")
+    lines.append("=" * 50)
+    
+    total = stats['total_commits']
+    lines.append(f"\nTotal commits tracked: {total}")
+    
+    if stats['by_agent']:
+        lines.append("\n🤖 By Agent:")
+        for agent, count in sorted(stats['by_agent'].items(), key=itemgetter(1), reverse=True):
+            percentage = (count / total * 100) if total > 0 else 0
+            bar = PERCENT_BARS[min(20, int(percentage // 5))]
+            lines.append(f"  {agent:20} {count:4} commits ({percentage:5.1f}%) {bar}")
+    
+    if stats['by_ide']:
+        lines.append("\n💻 By IDE:")
+        for ide, count in sorted(stats['by_ide'].items(), key=itemgetter(1), reverse=True):
+            percentage = (count / total * 100) if total > 0 else 0
+            bar = PERCENT_BARS[min(20, int(percentage // 5))]
+            lines.append(f"  {ide:20} {count:4} commits ({percentage:5.1f}%) {bar}")
+    
+    if stats['by_environment']:
+        lines.append("\n🌍 By Environment:")
+        for env, count in sorted(stats['by_environment'].items(), key=itemgetter(1), reverse=True):
+            percentage = (count / total * 100) if total > 0 else 0
+            lines.append(f"  {env:20} {count:4} commits ({percentage:5.1f}%)")
+    
+    if stats['top_tools']:
+        lines.append("\n🔧 Top Tools:")
+        for tool, count in heapq.nlargest(10, stats['top_tools'].items(), key=itemgetter(1)):
+            lines.append(f"  {tool:20} {count:4} commits")
+    
+    if stats['top_skills']:
+        lines.append("\n🎯 Top Skills/Languages:")
+        for skill, count in heapq.nlargest(10, stats['top_skills'].items(), key=itemgetter(1)):
+            lines.append(f"  {skill:20} {count:4} commits")
+    
+    lines.append('')
+    
+    click.echo('\n'.join(lines))
+
+
+@click.command()
+@click.argument('project_path')
+@click.option('--config', '-c', help='Path to config file')
+def analyze_authorship(project_path, config):
+    """Analyze authorship for a specific project."""
+    parakeet = get_parakeet(config)
+    
+    project_path = Path(project_path).resolve()
+    
+    if not project_path.exists():
+        click.echo(f"❌ Project path does not exist: {project_path}")
+        return
+    
+    click.echo(f"\n🔍 Analyzing authorship for: {project_path.name}\n")
+    
+    # Detect current state
+    agent = parakeet.authorship_tracker.detect_agent_from_environment()
+    proc_agent = parakeet.authorship_tracker.detect_agent_from_processes()
+    ide = parakeet.authorship_tracker.detect_ide()
+    env = parakeet.authorship_tracker.detect_environment()
+    tools = parakeet.authorship_tracker.detect_tools(project_path)
+    skills = parakeet.authorship_tracker.detect_skills(project_path)
+    orch = parakeet.authorship_tracker.detect_orchestration(project_path)
+    
+    lines = []
+    lines.append("Current Detection:")
+    lines.append(f"  Agent (env):       {agent}")
+    lines.append(f"  Agent (process):   {proc_agent}")
+    lines.append(f"  IDE:               {ide}")
+    lines.append(f"  Environment:       {env}")
+    lines.append(f"  Orchestration:     {orch}")
+    lines.append(f"  Tools:             {', '.join(tools) if tools else 'none detected'}")
+    lines.append(f"  Skills/Languages:  {', '.join(skills) if skills else 'none detected'}")
+    
+    # Analyze git commits if it's a git repo
+    try:
+        repo = get_git().Repo(project_path)
+        
+        lines.append(f"\n📚 Recent Commits (last 10):")
+        
+        for commit in repo.iter_commits(max_count=10):
+            sha = commit.hexsha[:8]
+            message = commit.message.partition('\n')[0][:50]
+            agent = parakeet.authorship_tracker.detect_agent_from_commit_message(commit.message)
+            
+            agent_icon = AGENT_ICONS.get(agent, UNKNOWN_AGENT_ICON)
+            
+            lines.append(f"  {agent_icon} {sha} {agent:15} {message}")
+    except Exception as e:
+        lines.append(f"\n⚠️  Not a git repository or error reading commits")
+    
+    lines.append('')
+    
+    click.echo('\n'.join(lines))
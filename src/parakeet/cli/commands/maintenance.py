@@ -0,0 +1,78 @@
+"""Git maintenance and project documentation commands."""
+
+from pathlib import Path
+
+import click
+
+from ..common import get_parakeet, play_sound
+
+
+@click.command()
+@click.argument('project_path')
+@click.option('--config', '-c', help='Path to config file')
+def maintain(project_path, config):
+    """Perform git maintenance on a project (auto-commit, push)."""
+    parakeet = get_parakeet(config)
+
+    click.echo(f"\n🔧 Running git maintenance on {Path(project_path).name}...\n")
+
+    result = parakeet.git_maintainer.perform_maintenance(project_path)
+
+    if result['success']:
+        # Play happy sound for successful maintenance
+        play_sound("happy")
+        click.echo("✅ Maintenance completed successfully:")
+        for action in result['actions']:
+            click.echo(f"  • {action}")
+    else:
+        # Play alert sound for failure
+        play_sound("alert")
+        click.echo(f"❌ Maintenance failed: {result['error']}")
+
+
+@click.command()
+@click.argument('project_path')
+@click.option('--enabled/--disabled', default=True, help='Enable or disable auto-commit')
+@click.option('--config', '-c', help='Path to config file')
+def auto_commit(project_path, enabled, config):
+    """Enable or disable auto-commit for a project."""
+    parakeet = get_parakeet(config)
+    parakeet.git_maintainer.set_auto_commit(project_path, enabled)
+    
+    status = "enabled" if enabled else "disabled"
+    click.echo(f"✅ Auto-commit {status} for {Path(project_path).name}")
+
+
+@click.command()
+@click.argument('project_path')
+@click.option('--enabled/--disabled', default=True, help='Enable or disable auto-push')
+@click.option('--config', '-c', help='Path to config file')
+def auto_push(project_path, enabled, config):
+    """Enable or disable auto-push for a project."""
+    parakeet = get_parakeet(config)
+    parakeet.git_maintainer.set_auto_push(project_path, enabled)
+    
+    status = "enabled" if enabled else "disabled"
+    click.echo(f"✅ Auto-push {status} for {Path(project_path).name}")
+
+
+@click.command()
+@click.argument('project_path')
+@click.option('--config', '-c', help='Path to config file')
+def changelog(project_path, config):
+    """View changelog for a project."""
+    parakeet = get_parakeet(config)
+    
+    md = parakeet.changelog.generate_changelog_markdown(project_path)
+    click.echo(md)
+
+
+@click.command()
+@click.argument('project_path')
+@click.option('--config', '-c', help='Path to config file')
+def time_report(project_path, config):
+    """View time tracking report for a project."""
+    parakeet = get_parakeet(config)
+
+    md = parakeet.changelog.generate_time_report(project_path)
+    click.echo(md)
@@ -0,0 +1,38 @@
+"""Mac menu bar app command."""
+
+import sys
+
+import click
+
+from ..common import play_sound
+
+
+@click.command()
+@click.option('--config', '-c', help='Path to config file')
+def menubar(config):
+    """Launch the Mac menu bar app (macOS only)."""
+    # Don't try to import rumps/AppKit where they can never load
+    if sys.platform != 'darwin':
+        play_sound("alert")
+        click.echo("❌ Menu bar app requires macOS")
+        return
+
+    try:
+        from ...menubar_app import ParakeetMenuBarApp
+
+        # Play hello sound when starting menubar app
+        play_sound("hello")
+
+        click.echo("\n🦜 Starting Friendly Parakeet Menu Bar App...")
+        click.echo("Look for the parakeet icon in your menu bar!")
+        click.echo("Press Ctrl+C to quit\n")
+
+        app = ParakeetMenuBarApp()
+        app.run()
+    except ImportError as e:
+        play_sound("alert")
+        click.echo(f"❌ Menu bar app requires macOS dependencies: {e}")
+        click.echo("Install with: pip install -r requirements-mac.txt")
+    except Exception as e:
+        play_sound("alert")
+        click.echo(f"❌ Error starting menu bar app: {e}")
@@ -0,0 +1,234 @@
+"""Watch path commands and the interactive setup wizard."""
+
+import os
+
+import click
+
+from ..common import check_paths_exist, expand_path, play_sound
+
+
+# Common places people keep their code, relative to $HOME
+SUGGESTED_DIRS = ('coding', 'projects', 'dev', 'work', 'Documents/code')
+
+
+def find_suggested_dirs():
+    """Find which suggested code directories exist under the home directory.
+
+    Each parent directory is listed once with os.scandir instead of
+    stat-ing every candidate path individually.
+
+    Returns:
+        List of existing suggested directories, in SUGGESTED_DIRS order
+    """
+    home = expand_path('~')
+    wanted = {}
+    for rel in SUGGESTED_DIRS:
+        parent, _, name = rel.rpartition('/')
+        wanted.setdefault(parent, set()).add(name)
+
+    found = set()
+    for parent, names in wanted.items():
+        parent_dir = os.path.join(home, parent) if parent else home
+        try:
+            with os.scandir(parent_dir) as entries:
+                for entry in entries:
+                    if entry.name in names and entry.is_dir():
+                        found.add(f"{parent}/{entry.name}" if parent else entry.name)
+        except OSError:
+            continue
+
+    return [os.path.join(home, rel) for rel in SUGGESTED_DIRS if rel in found]
+
+
+def _prompt_paths(initial, prompt):
+    """Prompt for existing paths to add until a blank answer is given.
+
+    Args:
+        initial: Paths to start from
+        prompt: Prompt text shown for each path
+
+    Returns:
+        Deduplicated list of initial and added paths, in order
+    """
+    paths = list(initial)
+    while True:
+        path = click.prompt(prompt, default="", show_default=False)
+        if not path:
+            return list(dict.fromkeys(paths))
+        path = expand_path(path)
+        if os.path.exists(path):
+            paths.append(path)
+            click.echo(f"  ✅ Added: {path}")
+        else:
+            click.echo(f"  ❌ Path does not exist: {path}")
+
+
+@click.command()
+@click.argument('path')
+@click.option('--config', '-c', help='Path to config file')
+def add_path(path, config):
+    """Add a directory to watch paths."""
+    from ...config import get_config
+    cfg = get_config(config)
+
+    path = expand_path(path)
+    if not os.path.exists(path):
+        play_sound("alert")
+        click.echo(f"❌ Path does not exist: {path}")
+        return
+
+    watch_paths = cfg.get('watch_paths', [])
+    if path in {expand_path(p) for p in watch_paths}:
+        click.echo(f"ℹ️  Path already in watch list: {path}")
+        return
+
+    watch_paths.append(path)
+    cfg.set('watch_paths', watch_paths)
+
+    play_sound("happy")
+    click.echo(f"✅ Added to watch paths: {path}")
+    click.echo(f"   Total watch paths: {len(watch_paths)}")
+
+
+@click.command()
+@click.argument('path')
+@click.option('--config', '-c', help='Path to config file')
+def remove_path(path, config):
+    """Remove a directory from watch paths."""
+    from ...config import get_config
+    cfg = get_config(config)
+
+    path = expand_path(path)
+    watch_paths = cfg.get('watch_paths', [])
+    # First index of each expanded path, for O(1) lookup
+    expanded_index = {}
+    for i, p in enumerate(watch_paths):
+        expanded_index.setdefault(expand_path(p), i)
+
+    idx = expanded_index.get(path)
+    if idx is None:
+        play_sound("alert")
+        click.echo(f"❌ Path not in watch list: {path}")
+        click.echo(f"\nCurrent watch paths:")
+        for wp in watch_paths:
+            click.echo(f"  • {wp}")
+        return
+
+    # Remove by expanded path
+    removed = watch_paths.pop(idx)
+    cfg.set('watch_paths', watch_paths)
+
+    play_sound("chirp")
+    click.echo(f"✅ Removed from watch paths: {removed}")
+    click.echo(f"   Total watch paths: {len(watch_paths)}")
+
+
+@click.command()
+@click.option('--config', '-c', help='Path to config file')
+def list_paths(config):
+    """List all watch paths."""
+    from ...config import get_config
+    cfg = get_config(config)
+
+    watch_paths = cfg.get('watch_paths', [])
+    recursive = cfg.get('scan_recursive', True)
+    max_depth = cfg.get('scan_max_depth', 3)
+
+    play_sound("chirp")
+    lines = []
+    lines.append("\n📂 Watch Paths Configuration\n")
+    lines.append(f"Scan mode: {'Recursive' if recursive else 'Immediate subdirectories only'}")
+    if recursive:
+        lines.append(f"Max depth: {max_depth} levels")
+    lines.append(f"\nWatch paths ({len(watch_paths)}):")
+
+    for path, expanded, exists in check_paths_exist(watch_paths):
+        status = "✅" if exists else "❌"
+        lines.append(f"  {status} {path}")
+        if not exists:
+            lines.append(f"      (Path does not exist: {expanded})")
+
+    click.echo('\n'.join(lines))
+
+
+@click.command()
+@click.option('--config', '-c', help='Path to config file')
+def setup(config):
+    """Interactive setup wizard for first-time configuration."""
+    from ...config import get_config
+
+    play_sound("hello")
+    click.echo("\n🦜 Welcome to Friendly Parakeet Setup!\n")
+    click.echo("Let's configure where to look for your coding projects.\n")
+
+    cfg = get_config(config)
+    current_paths = cfg.get('watch_paths', [])
+    # Collected answers, saved together once the wizard is done
+    updates = {}
+
+    click.echo("Current watch paths:")
+    for path in current_paths:
+        click.echo(f"  • {path}")
+
+    click.echo("\n")
+    if click.confirm("Would you like to modify watch paths?"):
+        # Suggest common directories
+        existing_suggestions = find_suggested_dirs()
+
+        if existing_suggestions:
+            click.echo("\n📁 Found these directories on your system:")
+            for path in existing_suggestions:
+                click.echo(f"  • {path}")
+
+            if click.confirm("\nAdd all found directories to watch paths?"):
+                watch_paths = list(dict.fromkeys([*current_paths, *existing_suggestions]))
+                updates['watch_paths'] = watch_paths
+                click.echo(f"\n✅ Added {len(existing_suggestions)} directories")
+            else:
+                click.echo("\nAdd directories one by one? (enter blank to finish)")
+                updates['watch_paths'] = _prompt_paths(
+                    current_paths, "Path to add (or press Enter to finish)")
+        else:
+            click.echo("\nEnter paths to watch (one per line, blank to finish):")
+            updates['watch_paths'] = _prompt_paths(current_paths, "Path")
+
+    # Configure scanning behavior
+    click.echo("\n")
+    if click.confirm("Would you like to configure scanning depth?"):
+        recursive = click.confirm("Scan recursively into subdirectories?", default=True)
+        updates['scan_recursive'] = recursive
+
+        if recursive:
+            max_depth = click.prompt(
+                "Maximum depth for recursive scanning",
+                type=int,
+                default=3,
+                show_default=True
+            )
+            updates['scan_max_depth'] = max_depth
+            click.echo(f"\n✅ Will scan up to {max_depth} levels deep")
+        else:
+            click.echo("\n✅ Will scan immediate subdirectories only")
+
+    cfg.update(updates)
+
+    # Summary
+    final_paths = cfg.get('watch_paths', [])
+    play_sound("happy")
+    click.echo("\n" + "="*60)
+    click.echo("🎉 Setup Complete!")
+    click.echo("="*60)
+    click.echo(f"\nWatching {len(final_paths)} directories:")
+    for path in final_paths:
+        click.echo(f"  • {path}")
+
+    if cfg.get('scan_recursive', True):
+        click.echo(f"\nRecursive scanning: {cfg.get('scan_max_depth', 3)} levels deep")
+    else:
+        click.echo("\nScanning: Immediate subdirectories only")
+
+    click.echo("\nNext steps:")
+    click.echo("  1. Run 'parakeet scan' to discover your projects")
+    click.echo("  2. Run 'parakeet dashboard' to see your progress")
+    click.echo("  3. Run 'parakeet menubar' to launch the Mac app")
+    click.echo("\n")
@@ -0,0 +1,44 @@
+"""Configuration commands."""
+
+import json
+
+import click
+
+from ..common import dump_json
+
+
+# First characters a JSON document can start with
+JSON_START_CHARS = frozenset('{["tfn-0123456789')
+
+
+@click.command()
+@click.argument('key')
+@click.argument('value')
+@click.option('--config', '-c', help='Path to config file')
+def config_set(key, value, config):
+    """Set a configuration value."""
+    from ...config import get_config
+    cfg = get_config(config)
+    
+    # Try to parse value as JSON for lists/dicts/numbers/booleans. Plain
+    # strings like ~/code can't be JSON, so skip the parse attempt for them.
+    parsed_value = value
+    if value.lstrip()[:1] in JSON_START_CHARS:
+        try:
+            parsed_value = json.loads(value)
+        except json.JSONDecodeError:
+            pass
+    
+    cfg.set(key, parsed_value)
+    click.echo(f"✅ Set {key} = {parsed_value}")
+
+
+@click.command()
+@click.option('--config', '-c', help='Path to config file')
+def config_show(config):
+    """Show current configuration."""
+    from ...config import get_config
+    cfg = get_config(config)
+    
+    click.echo("\n⚙️  Current Configuration:\n")
+    click.echo(dump_json(cfg.config))
@@ -0,0 +1,113 @@
+"""Project tracking commands: scan, status, breadcrumbs and the dashboard."""
+
+from pathlib import Path
+
+import click
+
+from ..common import get_parakeet, play_sound
+
+
+@click.command()
+@click.option('--config', '-c', help='Path to config file')
+def scan(config):
+    """Scan projects and update tracking data."""
+    parakeet = get_parakeet(config)
+    projects = parakeet.scan_and_update()
+
+    # Play chirp sound for scan completion
+    play_sound("chirp")
+
+    click.echo(f"\n✅ Scanned {len(projects)} project(s)")
+
+    # Show summary
+    for project in projects:
+        summary = parakeet.tracker.get_project_summary(project['path'])
+        velocity = summary['velocity']
+        inactivity = summary['inactivity_days']
+
+        status_icon = "🟢" if inactivity < 7 else "🟡" if inactivity < 30 else "🔴"
+        click.echo(f"{status_icon} {project['name']}: "
+                   f"{velocity['active_days']} active days, "
+                   f"trend: {velocity['trend']}")
+
+
+@click.command()
+@click.argument('project_path', required=False)
+@click.option('--config', '-c', help='Path to config file')
+def breadcrumb(project_path, config):
+    """View breadcrumbs for a project or all projects."""
+    parakeet = get_parakeet(config)
+
+    if project_path:
+        # Show breadcrumbs for specific project
+        breadcrumbs = parakeet.breadcrumbs.get_breadcrumbs(project_path)
+        if not breadcrumbs:
+            click.echo(f"No breadcrumbs found for {project_path}")
+            return
+
+        # Play chirp sound when showing breadcrumbs
+        play_sound("chirp")
+
+        click.echo(f"\n📍 Breadcrumbs for {Path(project_path).name}:\n")
+        for crumb in breadcrumbs:
+            click.echo(f"Timestamp: {crumb['timestamp']}")
+            click.echo(f"Status: {crumb['status']}")
+            click.echo(f"Inactive days: {crumb['inactivity_days']}")
+            click.echo("\nPrompt suggestions:")
+            for i, suggestion in enumerate(crumb['prompt_suggestions'], 1):
+                click.echo(f"  {i}. {suggestion}")
+            click.echo("\n" + "-" * 60 + "\n")
+    else:
+        # Show all breadcrumbs
+        all_breadcrumbs = parakeet.breadcrumbs.get_all_breadcrumbs()
+        if not all_breadcrumbs:
+            click.echo("No breadcrumbs found. Run 'parakeet scan' first.")
+            return
+
+        # Play chirp sound
+        play_sound("chirp")
+
+        click.echo(f"\n📍 All Breadcrumbs:\n")
+        for path, crumbs in all_breadcrumbs.items():
+            click.echo(f"{Path(path).name}: {len(crumbs)} breadcrumb(s)")
+
+
+@click.command()
+@click.option('--config', '-c', help='Path to config file')
+@click.option('--port', '-p', default=5000, help='Port to run dashboard on')
+@click.option('--host', '-h', default='127.0.0.1', help='Host to bind to')
+def dashboard(config, port, host):
+    """Start the dashboard web interface."""
+    from ...dashboard import create_app
+
+    parakeet = get_parakeet(config)
+    app = create_app(parakeet)
+
+    # Play hello sound when starting dashboard
+    play_sound("hello")
+
+    click.echo(f"\n🦜 Starting Friendly Parakeet Dashboard...")
+    click.echo(f"🌐 Open http://{host}:{port} in your browser\n")
+
+    try:
+        app.run(host=host, port=port, debug=False)
+    finally:
+        parakeet.close()
+
+
+@click.command()
+@click.option('--config', '-c', help='Path to config file')
+def status(config):
+    """Show overall status and statistics."""
+    parakeet = get_parakeet(config)
+    data = parakeet.get_status_summary(activity_limit=10)
+    
+    click.echo("\n🦜 Friendly Parakeet Status\n")
+    click.echo(f"Total projects: {data['stats']['total_projects']}")
+    click.echo(f"Active projects: {data['stats']['active_projects']}")
+    click.echo(f"Total breadcrumbs: {data['stats']['total_breadcrumbs']}")
+    
+    click.echo("\n📊 Recent Activity:\n")
+    for activity in data['activity_log']:
+        icon = "📍" if activity['type'] == 'breadcrumb' else "✏️"
+        click.echo(f"{icon} {activity['timestamp'][:10]} - {activity['details']}")
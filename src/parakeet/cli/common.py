@@ -0,0 +1,86 @@
+"""Helpers shared by the CLI command modules."""
+
+import json
+import os
+import sys
+from functools import lru_cache
+
+try:
+    import orjson  # Optional, much faster JSON encoding
+except ImportError:
+    orjson = None
+
+
+# Watch paths are expanded many times per command; $HOME does not change mid-run
+expand_path = lru_cache(maxsize=256)(os.path.expanduser)
+
+
+def dump_json(obj):
+    """Pretty-print an object as JSON, using orjson when it is installed.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        JSON string indented by two spaces
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            pass  # e.g. non-string keys from a hand-edited config
+    return json.dumps(obj, indent=2)
+
+
+def play_sound(sound_name):
+    """Play a parakeet sound, importing the sound module on first use.
+
+    Nothing is played when output is piped or redirected (scripts, CI) or
+    when PARAKEET_NO_SOUND is set.
+
+    Args:
+        sound_name: Name of the sound (hello, chirp, happy, alert, ...)
+    """
+    if os.environ.get('PARAKEET_NO_SOUND') or not sys.stdout.isatty():
+        return
+    from ..sounds import play_sound as _play
+    _play(sound_name)
+
+
+def check_paths_exist(paths):
+    """Check which paths exist, stat-ing them concurrently.
+
+    Watch paths may live on network mounts where each stat is a round
+    trip, so larger lists are checked on a small thread pool.
+
+    Args:
+        paths: Paths to check (``~`` is expanded)
+
+    Returns:
+        List of (path, expanded path, exists) tuples in input order
+    """
+    expanded = [expand_path(p) for p in paths]
+    if len(expanded) <= 2:
+        exists = [os.path.exists(p) for p in expanded]
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(32, len(expanded))) as executor:
+            exists = list(executor.map(os.path.exists, expanded))
+    return list(zip(paths, expanded, exists))
+
+
+@lru_cache(maxsize=4)
+def get_parakeet(config_path=None):
+    """Get a Parakeet instance for a config path, built once per process.
+
+    Commands invoked repeatedly in the same process (scripts, tests, the
+    menu bar app) share one instance instead of re-reading every data file.
+
+    Args:
+        config_path: Optional path to config file
+
+    Returns:
+        Parakeet instance
+    """
+    from ..parakeet import Parakeet
+    return Parakeet(config_path)
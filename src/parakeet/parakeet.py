@@ -1,11 +1,14 @@
 """Main orchestrator for Friendly Parakeet."""
 
+import heapq
 import logging
+import time
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple, Union
 from datetime import datetime
 
-from .config import Config
+from .config import get_config
 from .scanner import ProjectScanner
 from .tracker import ProjectTracker
 from .breadcrumbs import BreadcrumbGenerator
@@ -20,72 +23,103 @@ logger = logging.getLogger(__name__)
 class Parakeet:
     """Main orchestrator for project tracking and monitoring."""
     
+    # Seconds to reuse computed dashboard data before rebuilding it
+    DASHBOARD_CACHE_TTL = 60
+    
     def __init__(self, config_path: str = None):
         """Initialize Parakeet.
         
         Args:
             config_path: Optional path to config file
         """
-        self.config = Config(config_path)
+        self.config = get_config(config_path)
         self.scanner = ProjectScanner(
             self.config.watch_paths,
             self.config.get('exclude_patterns', []),
             max_depth=self.config.get('scan_max_depth', 3),
-            recursive=self.config.get('scan_recursive', True)
+            recursive=self.config.get('scan_recursive', True),
+            data_dir=self.config.data_dir,
         )
         self.tracker = ProjectTracker(self.config.data_dir)
         self.breadcrumbs = BreadcrumbGenerator(self.config.data_dir)
-        self.git_maintainer = GitMaintainer(self.config.data_dir)
+        self.git_maintainer = GitMaintainer(
+            self.config.data_dir,
+            skip_hooks=self.config.get('auto_commit_skip_hooks', True),
+        )
         self.changelog = ChangelogManager(self.config.data_dir)
         self.authorship_tracker = AuthorshipTracker(self.config.data_dir)
+        self._dashboard_cache = None  # (monotonic time, data)
     
-    def scan_and_update(self) -> List[Dict[str, Any]]:
+    def close(self):
+        """Release resources held for reuse, such as open git repositories."""
+        self.git_maintainer.close()
+    
+    def scan_and_update(self, return_stats: bool = False
+                        ) -> Union[List[Dict[str, Any]], List[Tuple[str, int, int]]]:
         """Scan projects and update tracking data.
         
+        Args:
+            return_stats: Return each project's (path, inactivity days,
+                breadcrumb count) instead of the project dictionaries
+        
         Returns:
-            List of updated projects
+            List of updated projects, or their stats if return_stats is set
         """
         print("🦜 Friendly Parakeet is scanning your projects...")
+        self._dashboard_cache = None
         
         # Scan for projects
         projects = self.scanner.scan_projects()
         print(f"Found {len(projects)} project(s)")
         
-        # Update tracking for each project
-        for project in projects:
-            self.tracker.update_project(project)
-            
-            # Check if breadcrumb needed
-            inactivity_days = self.tracker.get_inactivity_days(project['path'])
-            threshold = self.config.get('breadcrumb_threshold', 7)
-            
-            if inactivity_days >= threshold:
-                # Generate breadcrumb
-                breadcrumb = self.breadcrumbs.generate_breadcrumb(
-                    project, inactivity_days
-                )
-                if breadcrumb:
-                    self.breadcrumbs.add_breadcrumb(project['path'], breadcrumb)
-                    print(f"  📍 Created breadcrumb for {project['name']} "
-                          f"(inactive for {inactivity_days} days)")
-            
-            # Perform git maintenance if enabled
-            if self.config.get('git_maintenance_enabled', True):
-                result = self.git_maintainer.perform_maintenance(project['path'])
-                if result['actions']:
-                    print(f"  🔧 {project['name']}: {', '.join(result['actions'])}")
-            
-            # Generate project documentation
-            if self.config.get('generate_docs', True):
-                self.changelog.write_project_docs(
-                    project['path'], 
-                    project.get('type', 'unknown')
-                )
+        # Update tracking for each project, saving maintenance data once at the end
+        stats = []
+        with self.git_maintainer:
+            for project in projects:
+                self.tracker.update_project(project)
+                
+                # Check if breadcrumb needed
+                inactivity_days = self.tracker.get_inactivity_days(project['path'])
+                threshold = self.config.get('breadcrumb_threshold', 7)
+                
+                if inactivity_days >= threshold:
+                    # Generate breadcrumb
+                    breadcrumb = self.breadcrumbs.generate_breadcrumb(
+                        project, inactivity_days
+                    )
+                    if breadcrumb:
+                        self.breadcrumbs.add_breadcrumb(project['path'], breadcrumb)
+                        print(f"  📍 Created breadcrumb for {project['name']} "
+                              f"(inactive for {inactivity_days} days)")
+                
+                if return_stats:
+                    stats.append((project['path'], inactivity_days,
+                                  len(self.breadcrumbs.get_breadcrumbs(project['path']))))
+                
+                # Perform git maintenance if enabled
+                if self.config.get('git_maintenance_enabled', True):
+                    result = self.git_maintainer.perform_maintenance(
+                        project['path'], background_push=True)
+                    if result['actions']:
+                        print(f"  🔧 {project['name']}: {', '.join(result['actions'])}")
+                
+                # Generate project documentation
+                if self.config.get('generate_docs', True):
+                    self.changelog.write_project_docs(
+                        project['path'], 
+                        project.get('type', 'unknown')
+                    )
+                
+                # Track authorship for recent commits
+                if self.config.get('track_authorship', True):
+                    self._track_project_authorship(project['path'])
             
-            # Track authorship for recent commits
-            if self.config.get('track_authorship', True):
-                self._track_project_authorship(project['path'])
+            # Report pushes that ran while the remaining projects were processed
+            for result in self.git_maintainer.wait_for_pending_pushes():
+                print(f"  🔧 {Path(result['project_path']).name}: {result['actions'][-1]}")
         
+        if return_stats:
+            return stats
         return projects
     
     def _track_project_authorship(self, project_path: str):
@@ -99,13 +133,13 @@ class Parakeet:
             
             repo = git.Repo(project_path)
             
-            # Get recent commits (last 10)
-            commits = list(repo.iter_commits(max_count=10))
+            # SHAs we already tracked, collected once rather than per commit
+            existing = self.authorship_tracker.authorship_data.get('commits', [])
+            tracked_shas = {c.get('sha') for c in existing}
             
-            for commit in commits:
-                # Check if we already tracked this commit
-                existing = self.authorship_tracker.authorship_data.get('commits', [])
-                if any(c.get('sha') == commit.hexsha for c in existing):
+            # Walk recent commits (last 10)
+            for commit in repo.iter_commits(max_count=10):
+                if commit.hexsha in tracked_shas:
                     continue
                 
                 # Track authorship metadata
@@ -135,6 +169,11 @@ class Parakeet:
         Returns:
             Dashboard data dictionary
         """
+        if self._dashboard_cache is not None:
+            cached_at, data = self._dashboard_cache
+            if time.monotonic() - cached_at < self.DASHBOARD_CACHE_TTL:
+                return data
+        
         # Get project summaries
         summaries = self.tracker.get_all_projects_summary()
         
@@ -144,38 +183,85 @@ class Parakeet:
         # Get all breadcrumbs
         all_breadcrumbs = self.breadcrumbs.get_all_breadcrumbs()
         
-        # Compile activity log
-        activity_log = []
-        for summary in summaries:
-            activity_log.append({
-                'timestamp': summary['last_activity'],
-                'project': summary['name'],
+        # Compile activity log, last 50 activities
+        activity_log = heapq.nlargest(
+            50, self._iter_activity(summaries, all_breadcrumbs),
+            key=itemgetter('timestamp'))
+        
+        data = {
+            'projects': summaries,
+            'breadcrumbs': all_breadcrumbs,
+            'activity_log': activity_log,
+            'stats': self._compute_stats(summaries, all_breadcrumbs),
+        }
+        self._dashboard_cache = (time.monotonic(), data)
+        return data
+    
+    def get_status_summary(self, activity_limit: int = 10) -> Dict[str, Any]:
+        """Get stats and most recent activity for the status command.
+        
+        Unlike get_dashboard_data, this skips velocity metrics and only
+        keeps the newest activity entries instead of sorting the full log.
+        
+        Args:
+            activity_limit: Maximum number of activity entries to return
+            
+        Returns:
+            Dictionary with 'stats' and 'activity_log' keys
+        """
+        projects = self.tracker.get_last_activity()
+        all_breadcrumbs = self.breadcrumbs.get_all_breadcrumbs()
+        
+        return {
+            'activity_log': heapq.nlargest(
+                activity_limit, self._iter_activity(projects, all_breadcrumbs),
+                key=itemgetter('timestamp')),
+            'stats': self._compute_stats(projects, all_breadcrumbs),
+        }
+    
+    def _iter_activity(self, projects: List[Dict[str, Any]],
+                       all_breadcrumbs: Dict[str, List[Dict[str, Any]]]):
+        """Yield unsorted activity log entries for projects and breadcrumbs.
+        
+        Args:
+            projects: Project summaries with 'name' and 'last_activity' keys
+            all_breadcrumbs: Breadcrumbs keyed by project path
+            
+        Yields:
+            Activity log entries
+        """
+        for project in projects:
+            yield {
+                'timestamp': project['last_activity'],
+                'project': project['name'],
                 'type': 'activity',
-                'details': f"Active in {summary['name']}"
-            })
+                'details': f"Active in {project['name']}"
+            }
         
-        # Add breadcrumb events
-        for project_path, crumbs in all_breadcrumbs.items():
+        for crumbs in all_breadcrumbs.values():
             for crumb in crumbs:
-                activity_log.append({
+                yield {
                     'timestamp': crumb['timestamp'],
                     'project': crumb['project_name'],
                     'type': 'breadcrumb',
                     'details': f"Breadcrumb created (inactive {crumb['inactivity_days']} days)"
-                })
-        
-        # Sort activity log by time
-        activity_log.sort(key=lambda x: x['timestamp'], reverse=True)
+                }
+    
+    def _compute_stats(self, projects: List[Dict[str, Any]],
+                       all_breadcrumbs: Dict[str, List[Dict[str, Any]]]) -> Dict[str, int]:
+        """Compute overall project and breadcrumb counts.
         
+        Args:
+            projects: Project summaries with an 'inactivity_days' key
+            all_breadcrumbs: Breadcrumbs keyed by project path
+            
+        Returns:
+            Statistics dictionary
+        """
         return {
-            'projects': summaries,
-            'breadcrumbs': all_breadcrumbs,
-            'activity_log': activity_log[:50],  # Last 50 activities
-            'stats': {
-                'total_projects': len(summaries),
-                'active_projects': sum(1 for s in summaries if s['inactivity_days'] < 7),
-                'total_breadcrumbs': sum(len(crumbs) for crumbs in all_breadcrumbs.values()),
-            }
+            'total_projects': len(projects),
+            'active_projects': sum(1 for p in projects if p['inactivity_days'] < 7),
+            'total_breadcrumbs': sum(len(crumbs) for crumbs in all_breadcrumbs.values()),
         }
     
     def get_project_details(self, project_path: str) -> Dict[str, Any]:
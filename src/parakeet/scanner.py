@@ -2,12 +2,22 @@
 
 import os
 import json
+import configparser
+import subprocess
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import git
 
 
+# Project analysis is I/O-bound (git and file stats), so use more threads
+# than cores.
+MAX_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
 class ProjectScanner:
     """Scans and identifies coding projects in watch paths."""
     
@@ -32,8 +42,15 @@ class ProjectScanner:
         '.git',
     ]
     
+    # Indicators split for matching a single directory listing; earlier
+    # entries in PROJECT_INDICATORS win when several are present.
+    _INDICATOR_NAMES = frozenset(i for i in PROJECT_INDICATORS if not i.startswith('*'))
+    _INDICATOR_SUFFIXES = tuple(i[1:] for i in PROJECT_INDICATORS if i.startswith('*'))
+    _INDICATOR_RANK = {indicator: rank for rank, indicator in enumerate(PROJECT_INDICATORS)}
+    
     def __init__(self, watch_paths: List[str], exclude_patterns: List[str],
-                 max_depth: int = 3, recursive: bool = True):
+                 max_depth: int = 3, recursive: bool = True,
+                 data_dir: Optional[Path] = None):
         """Initialize project scanner.
 
         Args:
@@ -41,11 +58,19 @@ class ProjectScanner:
             exclude_patterns: Patterns to exclude from scanning
             max_depth: Maximum depth for recursive scanning (0 = immediate subdirs only)
             recursive: Whether to scan recursively or just immediate subdirectories
+            data_dir: Directory to persist the git info cache in; the cache
+                is kept in memory only when not given
         """
         self.watch_paths = watch_paths
         self.exclude_patterns = exclude_patterns
         self.max_depth = max_depth
         self.recursive = recursive
+        # Git info by project path: {'signature': [...], 'info': {...}}
+        self.git_cache_file = Path(data_dir) / 'git_cache.json' if data_dir else None
+        self._git_cache = self._load_git_cache()
+        self._git_cache_dirty = False
+        # Guards the git cache from analysis worker threads
+        self._git_cache_lock = threading.Lock()
     
     def scan_projects(self) -> List[Dict[str, Any]]:
         """Scan all watch paths and identify projects.
@@ -55,88 +80,66 @@ class ProjectScanner:
         """
         projects = []
         seen_paths = set()  # Avoid duplicates from symlinks
-
-        for watch_path in self.watch_paths:
-            path = Path(watch_path)
-            if not path.exists():
-                continue
-
-            # Scan directories (recursive or immediate subdirs)
-            if self.recursive:
-                self._scan_recursive(path, projects, seen_paths, depth=0)
-            else:
-                self._scan_immediate(path, projects, seen_paths)
-
+        
+        frontier = [Path(watch_path) for watch_path in self.watch_paths
+                    if Path(watch_path).exists()]
+        
+        # Scan one depth level at a time (immediate subdirs only when not
+        # recursive). Candidates are listed serially, then analyzed in
+        # parallel since each project's git and stats I/O is independent.
+        levels = self.max_depth + 1 if self.recursive else 1
+        try:
+            with ThreadPoolExecutor(max_workers=MAX_SCAN_WORKERS) as executor:
+                for _ in range(levels):
+                    candidates = self._collect_candidates(frontier, seen_paths)
+                    if not candidates:
+                        break
+                    
+                    frontier = []
+                    results = executor.map(self._analyze_directory, candidates)
+                    for candidate, project_info in zip(candidates, results):
+                        if project_info:
+                            projects.append(project_info)
+                        else:
+                            # Only non-project directories are scanned deeper
+                            frontier.append(candidate)
+        finally:
+            self.flush_git_cache({project['path'] for project in projects})
+        
         return projects
-
-    def _scan_immediate(self, path: Path, projects: List[Dict[str, Any]],
-                       seen_paths: set) -> None:
-        """Scan immediate subdirectories only.
-
+    
+    def _collect_candidates(self, directories: List[Path], seen_paths: set) -> List[Path]:
+        """List the subdirectories of the given directories.
+        
         Args:
-            path: Path to scan
-            projects: List to append found projects to
-            seen_paths: Set of already-scanned paths to avoid duplicates
+            directories: Directories to list
+            seen_paths: Set of already-listed real paths, updated in place
+            
+        Returns:
+            Subdirectories not excluded and not seen before
         """
-        try:
-            for item in path.iterdir():
-                try:
-                    if item.is_dir() and not self._should_exclude(item.name):
-                        real_path = str(item.resolve())
-                        if real_path not in seen_paths:
+        candidates = []
+        for directory in directories:
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            if not entry.is_dir() or self._should_exclude(entry.name):
+                                continue
+                            
+                            # Avoid infinite loops from symlinks
+                            real_path = os.path.realpath(entry.path)
+                            if real_path in seen_paths:
+                                continue
                             seen_paths.add(real_path)
-                            project_info = self._analyze_directory(item)
-                            if project_info:
-                                projects.append(project_info)
-                except (PermissionError, OSError):
-                    # Skip directories we can't access
-                    continue
-        except (PermissionError, OSError):
-            # Skip paths we can't read
-            pass
-
-    def _scan_recursive(self, path: Path, projects: List[Dict[str, Any]],
-                       seen_paths: set, depth: int = 0) -> None:
-        """Recursively scan directories up to max_depth.
-
-        Args:
-            path: Path to scan
-            projects: List to append found projects to
-            seen_paths: Set of already-scanned paths to avoid duplicates
-            depth: Current recursion depth
-        """
-        # Check depth limit
-        if depth > self.max_depth:
-            return
-
-        try:
-            for item in path.iterdir():
-                try:
-                    if not item.is_dir() or self._should_exclude(item.name):
-                        continue
-
-                    # Avoid infinite loops from symlinks
-                    real_path = str(item.resolve())
-                    if real_path in seen_paths:
-                        continue
-                    seen_paths.add(real_path)
-
-                    # Check if this directory is a project
-                    project_info = self._analyze_directory(item)
-                    if project_info:
-                        projects.append(project_info)
-                        # Don't recurse into identified projects
-                        continue
-
-                    # Recurse into non-project directories
-                    self._scan_recursive(item, projects, seen_paths, depth + 1)
-
-                except (PermissionError, OSError):
-                    # Skip directories we can't access
-                    continue
-        except (PermissionError, OSError):
-            # Skip paths we can't read
-            pass
+                            candidates.append(Path(entry.path))
+                        except (PermissionError, OSError):
+                            # Skip directories we can't access
+                            continue
+            except (PermissionError, OSError):
+                # Skip paths we can't read
+                continue
+        return candidates
     
     def _should_exclude(self, name: str) -> bool:
         """Check if directory should be excluded.
@@ -159,33 +162,16 @@ class ProjectScanner:
             Project information dict or None if not a project
         """
         try:
-            # Check for project indicators
-            is_project = False
-            project_type = 'unknown'
-            
-            for indicator in self.PROJECT_INDICATORS:
-                try:
-                    if indicator.startswith('*'):
-                        # Glob pattern
-                        if list(path.glob(indicator)):
-                            is_project = True
-                            break
-                    else:
-                        if (path / indicator).exists():
-                            is_project = True
-                            project_type = self._detect_project_type(indicator)
-                            break
-                except (PermissionError, OSError):
-                    continue
-            
-            if not is_project:
+            indicator = self._find_indicator(path)
+            if indicator is None:
                 return None
-            
-            # Get git information if available
-            git_info = self._get_git_info(path)
+            project_type = self._detect_project_type(indicator)
             
             # Get file statistics
-            stats = self._get_directory_stats(path)
+            stats, tree_mtime_ns = self._walk_directory(path)
+            
+            # Get git information if available
+            git_info = self._get_git_info(path, tree_mtime_ns)
             
             return {
                 'name': path.name,
@@ -198,6 +184,32 @@ class ProjectScanner:
         except (PermissionError, OSError):
             return None
     
+    def _find_indicator(self, path: Path) -> Optional[str]:
+        """Find the project indicator present in a directory.
+        
+        Args:
+            path: Directory path to check
+            
+        Returns:
+            The highest-priority matching entry of PROJECT_INDICATORS, or
+            None if the directory has none
+        """
+        best = None
+        with os.scandir(path) as entries:
+            for entry in entries:
+                name = entry.name
+                if name in self._INDICATOR_NAMES:
+                    indicator = name
+                elif name.endswith(self._INDICATOR_SUFFIXES):
+                    indicator = '*' + os.path.splitext(name)[1]
+                else:
+                    continue
+                
+                if best is None or self._INDICATOR_RANK[indicator] < self._INDICATOR_RANK[best]:
+                    best = indicator
+                    if self._INDICATOR_RANK[best] == 0:
+                        break
+        return best
     
     def _detect_project_type(self, indicator: str) -> str:
         """Detect project type from indicator file.
@@ -222,8 +234,244 @@ class ProjectScanner:
         }
         return type_map.get(indicator, 'unknown')
     
-    def _get_git_info(self, path: Path) -> Optional[Dict[str, Any]]:
-        """Get git repository information.
+    def _load_git_cache(self) -> Dict[str, Any]:
+        """Load the persisted git info cache.
+        
+        Returns:
+            Cache entries by project path
+        """
+        if self.git_cache_file and self.git_cache_file.exists():
+            try:
+                with open(self.git_cache_file, 'r') as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                pass
+        return {}
+    
+    def flush_git_cache(self, keep_paths: Optional[set] = None):
+        """Write the git info cache if it changed.
+        
+        Args:
+            keep_paths: If given, drop entries for all other project paths
+        """
+        with self._git_cache_lock:
+            if keep_paths is not None:
+                for key in set(self._git_cache) - keep_paths:
+                    del self._git_cache[key]
+                    self._git_cache_dirty = True
+            if not self._git_cache_dirty or not self.git_cache_file:
+                return
+            try:
+                self.git_cache_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.git_cache_file, 'w') as f:
+                    json.dump(self._git_cache, f)
+                self._git_cache_dirty = False
+            except OSError:
+                pass
+    
+    def _git_signature(self, path: Path, tree_mtime_ns: Optional[int]) -> Optional[List[Any]]:
+        """Build the key that decides whether cached git info is still valid.
+        
+        Args:
+            path: Project path
+            tree_mtime_ns: Newest file or directory mtime in the project
+            
+        Returns:
+            HEAD and index mtimes, HEAD content, the commit sha HEAD resolves
+            to and the tree mtime, or None if the project has no readable
+            .git directory
+        """
+        git_dir = path / '.git'
+        try:
+            head_path = git_dir / 'HEAD'
+            head_mtime = head_path.stat().st_mtime_ns
+            head_content = head_path.read_text().strip()
+            if head_content.startswith('ref: '):
+                head_sha = self._resolve_ref(git_dir, head_content[len('ref: '):])
+            else:
+                head_sha = head_content
+        except (OSError, ValueError):
+            return None
+        try:
+            index_mtime = (git_dir / 'index').stat().st_mtime_ns
+        except OSError:
+            index_mtime = None  # No commits staged yet
+        return [head_mtime, index_mtime, head_content, head_sha, tree_mtime_ns]
+    
+    def _get_git_info(self, path: Path, tree_mtime_ns: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Get git repository information, reusing it while the repo is unchanged.
+
+        Args:
+            path: Project path
+            tree_mtime_ns: Newest file or directory mtime in the project, so
+                edits, deletions and renames that don't touch the index
+                still refresh the dirty flag
+
+        Returns:
+            Git info dict or None if not a git repo
+        """
+        signature = self._git_signature(path, tree_mtime_ns)
+        if signature is None:
+            return self._read_git_info(path)
+        
+        key = str(path.absolute())
+        cached = self._git_cache.get(key)
+        if cached and cached['signature'] == signature:
+            return cached['info']
+        
+        info = self._read_git_info(path)
+        # Sign again, as the dirty check may have refreshed the index
+        signature = self._git_signature(path, tree_mtime_ns)
+        if signature is not None:
+            with self._git_cache_lock:
+                self._git_cache[key] = {'signature': signature, 'info': info}
+                self._git_cache_dirty = True
+        return info
+    
+    def _read_git_info(self, path: Path) -> Optional[Dict[str, Any]]:
+        """Read git repository information, preferring the direct .git reads.
+
+        Args:
+            path: Project path
+
+        Returns:
+            Git info dict or None if not a git repo
+        """
+        info = self._get_git_info_fast(path)
+        if info is None:
+            info = self._get_git_info_gitpython(path)
+        return info
+    
+    def _get_git_info_fast(self, path: Path) -> Optional[Dict[str, Any]]:
+        """Read git repository information straight from the .git directory.
+        
+        Handles the common layout: a .git directory, loose commit objects and
+        loose or packed refs. Anything else is left to GitPython.
+        
+        Args:
+            path: Project path
+            
+        Returns:
+            Git info dict, or None if it couldn't be read this way
+        """
+        git_dir = path / '.git'
+        try:
+            head = (git_dir / 'HEAD').read_text().strip()
+            if head.startswith('ref: refs/heads/'):
+                branch = head[len('ref: refs/heads/'):]
+                sha = self._resolve_ref(git_dir, head[len('ref: '):])
+            elif not head.startswith('ref: '):
+                branch = 'detached'
+                sha = head
+            else:
+                return None
+            
+            last_commit_info = None
+            if sha:
+                last_commit_info = self._read_commit(git_dir, sha)
+                if last_commit_info is None:
+                    return None  # Packed object
+            
+            # Same check as GitPython's is_dirty(): staged or unstaged
+            # changes to tracked files
+            status = subprocess.run(
+                ['git', 'status', '--porcelain', '--untracked-files=no'],
+                cwd=path, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                check=True)
+            
+            return {
+                'branch': branch,
+                'last_commit': last_commit_info,
+                'is_dirty': bool(status.stdout.strip()),
+                'remote_url': self._read_remote_url(git_dir),
+            }
+        except (OSError, ValueError, IndexError, KeyError, zlib.error,
+                configparser.Error, subprocess.SubprocessError):
+            return None
+    
+    def _resolve_ref(self, git_dir: Path, ref: str) -> Optional[str]:
+        """Resolve a ref to a commit sha from loose or packed refs.
+        
+        Args:
+            git_dir: Repository .git directory
+            ref: Full ref name, e.g. refs/heads/main
+            
+        Returns:
+            Commit sha, or None if the ref doesn't exist yet (empty repo)
+        """
+        ref_path = git_dir / ref
+        if ref_path.is_file():
+            value = ref_path.read_text().strip()
+            if value.startswith('ref: '):
+                raise ValueError(f"Symbolic ref {ref}")
+            return value
+        
+        packed_refs = git_dir / 'packed-refs'
+        if packed_refs.is_file():
+            with open(packed_refs, 'r') as f:
+                for line in f:
+                    if line.startswith(('#', '^')):
+                        continue
+                    sha, _, name = line.strip().partition(' ')
+                    if name == ref:
+                        return sha
+        return None
+    
+    def _read_commit(self, git_dir: Path, sha: str) -> Optional[Dict[str, Any]]:
+        """Read a loose commit object.
+        
+        Args:
+            git_dir: Repository .git directory
+            sha: Commit sha
+            
+        Returns:
+            Last commit info dict, or None if the object is packed
+        """
+        object_path = git_dir / 'objects' / sha[:2] / sha[2:]
+        if not object_path.is_file():
+            return None
+        
+        data = zlib.decompress(object_path.read_bytes())
+        header, _, body = data.partition(b'\0')
+        if not header.startswith(b'commit '):
+            raise ValueError(f"{sha} is not a commit")
+        
+        headers, _, message = body.partition(b'\n\n')
+        fields = {}
+        for line in headers.split(b'\n'):
+            if line.startswith(b' '):
+                continue  # Continuation of a multi-line header (gpgsig)
+            key, _, value = line.partition(b' ')
+            fields.setdefault(key, value)
+        
+        # "Name <email> timestamp tz"
+        author = fields[b'author'].partition(b' <')[0]
+        committed_date = int(fields[b'committer'].rsplit(b' ', 2)[1])
+        return {
+            'sha': sha[:8],
+            'message': message.decode('utf-8', 'replace').strip(),
+            'author': author.decode('utf-8', 'replace'),
+            'date': datetime.fromtimestamp(committed_date).isoformat(),
+        }
+    
+    def _read_remote_url(self, git_dir: Path) -> Optional[str]:
+        """Read the origin remote URL from .git/config.
+        
+        Args:
+            git_dir: Repository .git directory
+            
+        Returns:
+            Remote URL or None
+        """
+        parser = configparser.ConfigParser(strict=False, allow_no_value=True,
+                                           interpolation=None)
+        # Git indents keys, which configparser would read as continuations
+        with open(git_dir / 'config', 'r') as f:
+            parser.read_string('\n'.join(line.strip() for line in f))
+        return parser.get('remote "origin"', 'url', fallback=None)
+    
+    def _get_git_info_gitpython(self, path: Path) -> Optional[Dict[str, Any]]:
+        """Read git repository information with GitPython.
 
         Args:
             path: Project path
@@ -321,27 +569,65 @@ class ProjectScanner:
         Returns:
             Statistics dictionary
         """
+        return self._walk_directory(path)[0]
+    
+    def _walk_directory(self, path: Path) -> Tuple[Dict[str, Any], Optional[int]]:
+        """Collect directory statistics and the newest change in the tree.
+        
+        Args:
+            path: Directory path
+            
+        Returns:
+            Statistics dictionary, and the newest mtime in nanoseconds of any
+            file or directory walked. Directory mtimes change when entries
+            are deleted or renamed, which file mtimes don't show.
+        """
         file_count = 0
         total_size = 0
-        last_modified = None
+        last_mtime = None
+        tree_mtime_ns = None
         
-        try:
-            for item in path.rglob('*'):
-                if item.is_file() and not any(ex in str(item) for ex in self.exclude_patterns):
-                    file_count += 1
-                    try:
-                        stat = item.stat()
+        # Walk with os.scandir, whose entries carry their type from the
+        # directory listing. A directory whose path contains an exclude
+        # pattern is skipped whole, as every path below it contains it too.
+        # Symlinked directories are not followed.
+        pending = [str(path)]
+        while pending:
+            directory = pending.pop()
+            if any(ex in directory for ex in self.exclude_patterns):
+                continue
+            try:
+                directory_mtime_ns = os.stat(directory).st_mtime_ns
+                if tree_mtime_ns is None or directory_mtime_ns > tree_mtime_ns:
+                    tree_mtime_ns = directory_mtime_ns
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending.append(entry.path)
+                                continue
+                            if not entry.is_file() or any(ex in entry.path for ex in self.exclude_patterns):
+                                continue
+                        except OSError:
+                            continue
+                        file_count += 1
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            continue
                         total_size += stat.st_size
-                        mtime = datetime.fromtimestamp(stat.st_mtime)
-                        if last_modified is None or mtime > last_modified:
-                            last_modified = mtime
-                    except (OSError, PermissionError):
-                        pass
-        except (OSError, PermissionError):
-            pass
+                        if last_mtime is None or stat.st_mtime > last_mtime:
+                            last_mtime = stat.st_mtime
+                        if tree_mtime_ns is None or stat.st_mtime_ns > tree_mtime_ns:
+                            tree_mtime_ns = stat.st_mtime_ns
+            except OSError:
+                # Skip directories we can't read
+                continue
+        
+        last_modified = datetime.fromtimestamp(last_mtime) if last_mtime is not None else None
         
         return {
             'file_count': file_count,
             'total_size': total_size,
             'last_modified': last_modified.isoformat() if last_modified else None,
-        }
+        }, tree_mtime_ns
@@ -69,7 +69,47 @@ class ProjectTracker:
         Returns:
             Velocity metrics dictionary
         """
-        if project_path not in self.history or len(self.history[project_path]) < 2:
+        return self._compute_velocity(self.history.get(project_path, []), window_days)
+    
+    def get_inactivity_days(self, project_path: str) -> int:
+        """Get number of days since last activity.
+        
+        Args:
+            project_path: Path to project
+            
+        Returns:
+            Days since last activity
+        """
+        return self._compute_inactivity_days(self.history.get(project_path, []))
+    
+    def get_project_summary(self, project_path: str, window_days: int = 30) -> Dict[str, Any]:
+        """Get velocity and inactivity for a project with one history lookup.
+        
+        Args:
+            project_path: Path to project
+            window_days: Number of days to calculate velocity over
+            
+        Returns:
+            Dictionary with 'velocity' and 'inactivity_days' keys
+        """
+        snapshots = self.history.get(project_path, [])
+        return {
+            'velocity': self._compute_velocity(snapshots, window_days),
+            'inactivity_days': self._compute_inactivity_days(snapshots),
+        }
+    
+    def _compute_velocity(self, snapshots: List[Dict[str, Any]],
+                          window_days: int) -> Dict[str, Any]:
+        """Calculate velocity metrics from a project's snapshots.
+        
+        Args:
+            snapshots: Project history snapshots, oldest first
+            window_days: Number of days to calculate velocity over
+            
+        Returns:
+            Velocity metrics dictionary
+        """
+        if len(snapshots) < 2:
             return {
                 'commits_per_day': 0,
                 'active_days': 0,
@@ -77,12 +117,12 @@ class ProjectTracker:
             }
         
         cutoff = datetime.now() - timedelta(days=window_days)
-        recent_snapshots = [
-            s for s in self.history[project_path]
-            if datetime.fromisoformat(s['timestamp']) > cutoff
+        recent_times = [
+            t for t in (datetime.fromisoformat(s['timestamp']) for s in snapshots)
+            if t > cutoff
         ]
         
-        if len(recent_snapshots) < 2:
+        if len(recent_times) < 2:
             return {
                 'commits_per_day': 0,
                 'active_days': 0,
@@ -90,21 +130,16 @@ class ProjectTracker:
             }
         
         # Calculate active days (days with changes)
-        active_dates = set()
-        for snapshot in recent_snapshots:
-            date = datetime.fromisoformat(snapshot['timestamp']).date()
-            active_dates.add(date)
-        
-        active_days = len(active_dates)
+        active_days = len({t.date() for t in recent_times})
         
         # Estimate commits (based on git info changes)
         # This is simplified - in real usage we'd track actual commits
         commits_per_day = active_days / window_days if window_days > 0 else 0
         
         # Determine trend
-        mid_point = len(recent_snapshots) // 2
+        mid_point = len(recent_times) // 2
         first_half_activity = mid_point
-        second_half_activity = len(recent_snapshots) - mid_point
+        second_half_activity = len(recent_times) - mid_point
         
         if second_half_activity > first_half_activity * 1.2:
             trend = 'increasing'
@@ -119,22 +154,38 @@ class ProjectTracker:
             'trend': trend,
         }
     
-    def get_inactivity_days(self, project_path: str) -> int:
-        """Get number of days since last activity.
+    def _compute_inactivity_days(self, snapshots: List[Dict[str, Any]]) -> int:
+        """Get days since the last snapshot.
         
         Args:
-            project_path: Path to project
+            snapshots: Project history snapshots, oldest first
             
         Returns:
             Days since last activity
         """
-        if project_path not in self.history or not self.history[project_path]:
+        if not snapshots:
             return 0
         
-        last_snapshot = self.history[project_path][-1]
-        last_time = datetime.fromisoformat(last_snapshot['timestamp'])
+        last_time = datetime.fromisoformat(snapshots[-1]['timestamp'])
         return (datetime.now() - last_time).days
     
+    def get_last_activity(self) -> List[Dict[str, Any]]:
+        """Get last activity of all tracked projects without velocity metrics.
+        
+        Returns:
+            List of dictionaries with 'name', 'last_activity' and
+            'inactivity_days' keys
+        """
+        return [
+            {
+                'name': Path(project_path).name,
+                'last_activity': snapshots[-1]['timestamp'],
+                'inactivity_days': self._compute_inactivity_days(snapshots),
+            }
+            for project_path, snapshots in self.history.items()
+            if snapshots
+        ]
+    
     def get_all_projects_summary(self) -> List[Dict[str, Any]]:
         """Get summary of all tracked projects.
         
@@ -148,15 +199,14 @@ class ProjectTracker:
                 continue
             
             last_snapshot = self.history[project_path][-1]
-            velocity = self.get_velocity(project_path)
-            inactivity = self.get_inactivity_days(project_path)
+            summary = self.get_project_summary(project_path)
             
             summaries.append({
                 'path': project_path,
                 'name': Path(project_path).name,
                 'last_activity': last_snapshot['timestamp'],
-                'inactivity_days': inactivity,
-                'velocity': velocity,
+                'inactivity_days': summary['inactivity_days'],
+                'velocity': summary['velocity'],
                 'stats': last_snapshot.get('stats', {}),
             })
         
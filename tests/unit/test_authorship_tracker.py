@@ -489,6 +489,32 @@ class TestAuthorshipTracking:
             claude_commits = tracker.query_by_agent("claude")
             assert len(claude_commits) == 2
 
+    def test_query_authorship_by_agent_with_limit(self):
+        """Test that a query stops after the requested number of matches."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tracker = AuthorshipTracker(Path(temp_dir))
+            
+            tracker.store_metadata("sha1", AuthorshipMetadata(agent="claude"))
+            tracker.store_metadata("sha2", AuthorshipMetadata(agent="copilot"))
+            tracker.store_metadata("sha3", AuthorshipMetadata(agent="claude"))
+            
+            claude_commits = tracker.query_by_agent("claude", limit=1)
+            assert [c["sha"] for c in claude_commits] == ["sha1"]
+
+    def test_iter_commits_combines_filters(self):
+        """Test iterating commits filtered by agent, IDE and project."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tracker = AuthorshipTracker(Path(temp_dir))
+            project = Path(temp_dir)
+            
+            tracker.store_metadata("sha1", AuthorshipMetadata(agent="claude", ide="cursor"), project)
+            tracker.store_metadata("sha2", AuthorshipMetadata(agent="claude", ide="vscode"), project)
+            tracker.store_metadata("sha3", AuthorshipMetadata(agent="claude", ide="cursor"))
+            
+            matches = tracker.iter_commits(agent="claude", ide="cursor",
+                                           project=str(project.resolve()))
+            assert [c["sha"] for c in matches] == ["sha1"]
+
     def test_query_authorship_by_ide(self):
         """Test querying commits by IDE."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -520,6 +546,21 @@ class TestAuthorshipTracking:
             assert "cursor" in stats["by_ide"]
             assert stats["by_ide"]["cursor"] == 2
 
+    def test_statistics_refresh_after_new_commit(self):
+        """Test cached statistics are recomputed once a commit is stored."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tracker = AuthorshipTracker(Path(temp_dir))
+            
+            tracker.store_metadata("sha1", AuthorshipMetadata(agent="claude", tools=["git"]))
+            assert tracker.get_statistics()["total_commits"] == 1
+            
+            tracker.store_metadata("sha2", AuthorshipMetadata(agent="claude", tools=["git"]))
+            stats = tracker.get_statistics()
+            
+            assert stats["total_commits"] == 2
+            assert stats["by_agent"]["claude"] == 2
+            assert stats["top_tools"]["git"] == 2
+
 
 class TestIntegrationWithGit:
     """Tests for integrating authorship tracking with git operations."""
@@ -0,0 +1,120 @@
+"""Tests for GitMaintainer against real temporary repositories."""
+import os
+import pytest
+import git
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from parakeet.git_maintenance import GitMaintainer
+
+
+@pytest.fixture
+def repo_with_changes(temp_dir: Path) -> git.Repo:
+    """Create a repository with more uncommitted changes than one commit takes.
+
+    Args:
+        temp_dir: Temporary directory fixture
+
+    Returns:
+        git.Repo with modified, deleted, renamed and untracked files
+    """
+    repo_path = temp_dir / "project"
+    repo_path.mkdir()
+    repo = git.Repo.init(repo_path)
+    repo.config_writer().set_value("user", "name", "Test User").release()
+    repo.config_writer().set_value("user", "email", "test@example.com").release()
+
+    for i in range(12):
+        (repo_path / f"module_{i}.py").write_text(f"value = {i}\n")
+    (repo_path / "deleted.py").write_text("gone = True\n")
+    (repo_path / "moved in worktree.txt").write_text("moved\n")
+    (repo_path / "staged_move.txt").write_text("staged\n")
+    repo.git.add(A=True)
+    repo.git.commit("-m", "Initial commit")
+
+    for i in range(12):
+        (repo_path / f"module_{i}.py").write_text(f"value = {i + 1}\n")
+    (repo_path / "deleted.py").unlink()
+    os.rename(repo_path / "moved in worktree.txt", repo_path / "renamed in worktree.txt")
+    repo.git.mv("staged_move.txt", "staged_renamed.txt")
+    (repo_path / "new notes.md").write_text("untracked\n")
+
+    return repo
+
+
+class TestStackedCommits:
+    """Tests for stacked auto-commits made through a copy of the index."""
+
+    @pytest.mark.unit
+    @pytest.mark.git
+    def test_stacked_commits_cover_all_changes(self, repo_with_changes, temp_dir):
+        """Test every kind of change is committed and the index is left in step."""
+        repo_path = Path(repo_with_changes.working_dir)
+        data_dir = temp_dir / "data"
+        data_dir.mkdir()
+        maintainer = GitMaintainer(data_dir)
+
+        result = maintainer.perform_maintenance(str(repo_path))
+
+        assert result["success"] is True, result
+        assert result["actions"][0].startswith("Created 3 stacked commits")
+        messages = [c.message.strip() for c in repo_with_changes.iter_commits(max_count=3)]
+        assert sorted(messages) == [
+            "Auto-commit: Update code (part 1, 10 files)",
+            "Auto-commit: Update code (part 2, 3 files)",
+            "Auto-commit: Update docs (3 files)",
+        ]
+
+        assert repo_with_changes.git.status("--porcelain", "--untracked-files=all") == ""
+        tracked = set(repo_with_changes.git.ls_files().splitlines())
+        assert {"module_0.py", "module_11.py", "new notes.md",
+                "renamed in worktree.txt", "staged_renamed.txt"} <= tracked
+        assert not {"deleted.py", "moved in worktree.txt", "staged_move.txt"} & tracked
+
+        git_dir = Path(repo_with_changes.git_dir)
+        assert not (git_dir / "index.lock").exists()
+        assert not (git_dir / "index.parakeet").exists()
+
+    @pytest.mark.unit
+    @pytest.mark.git
+    def test_stacked_commits_skip_locked_index(self, repo_with_changes, temp_dir):
+        """Test a held index.lock stops the run and is left alone."""
+        repo_path = Path(repo_with_changes.working_dir)
+        lock_file = Path(repo_with_changes.git_dir) / "index.lock"
+        lock_file.touch()
+        head = repo_with_changes.head.commit.hexsha
+        data_dir = temp_dir / "data"
+        data_dir.mkdir()
+        maintainer = GitMaintainer(data_dir)
+
+        result = maintainer.perform_maintenance(str(repo_path))
+
+        assert result["success"] is False
+        assert "locked" in result["error"]
+        assert lock_file.exists()
+        assert repo_with_changes.head.commit.hexsha == head
+
+
+class TestRepoCache:
+    """Tests for reusing and closing open repositories."""
+
+    @pytest.mark.unit
+    @pytest.mark.git
+    def test_expired_repos_are_closed_on_any_lookup(self, git_repo_with_commits, repo_with_changes, temp_dir):
+        """Test a lookup closes expired repositories of other projects too."""
+        maintainer = GitMaintainer(temp_dir)
+        first = maintainer._repo(git_repo_with_commits.working_dir)
+        assert maintainer._repo(git_repo_with_commits.working_dir) is first
+
+        maintainer.REPO_CACHE_TTL = 0
+        with patch.object(first, "close") as close:
+            maintainer._repo(repo_with_changes.working_dir)
+            close.assert_called_once()
+        assert git_repo_with_commits.working_dir not in maintainer._repo_cache
+
+        maintainer.close()
+        assert maintainer._repo_cache == {}
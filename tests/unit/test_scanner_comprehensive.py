@@ -241,6 +241,74 @@ class TestGitInformation:
         assert git_info is not None
         assert git_info["branch"] == "detached"
 
+    @pytest.mark.unit
+    @pytest.mark.git
+    def test_git_info_fast_matches_gitpython(self, git_repo_with_commits, detached_head_repo):
+        """Test reading .git directly gives the same info as GitPython."""
+        scanner = ProjectScanner([], [])
+
+        for repo in (git_repo_with_commits, detached_head_repo):
+            repo_path = Path(repo.working_dir)
+            git_info = scanner._get_git_info_fast(repo_path)
+
+            assert git_info is not None
+            assert git_info == scanner._get_git_info_gitpython(repo_path)
+
+    @pytest.mark.unit
+    @pytest.mark.git
+    def test_git_info_fast_falls_back_on_malformed_commit(self, temp_dir):
+        """Test a commit object without author or committer isn't fatal."""
+        import zlib
+
+        repo_path = temp_dir / "malformed"
+        repo_path.mkdir()
+        git.Repo.init(repo_path)
+        sha = "ab" + "0" * 38
+        body = b"tree " + b"0" * 40 + b"\n\nNo author\n"
+        object_dir = repo_path / ".git" / "objects" / sha[:2]
+        object_dir.mkdir(parents=True, exist_ok=True)
+        (object_dir / sha[2:]).write_bytes(zlib.compress(b"commit %d\0" % len(body) + body))
+        (repo_path / ".git" / "HEAD").write_text(sha + "\n")
+
+        scanner = ProjectScanner([], [])
+
+        assert scanner._get_git_info_fast(repo_path) is None
+        scanner._get_git_info(repo_path)  # Falls back to GitPython without raising
+
+    @pytest.mark.unit
+    @pytest.mark.git
+    def test_git_info_cached_while_repository_unchanged(self, git_repo_with_commits, temp_dir):
+        """Test git info is reused from the persisted cache until the repo changes."""
+        repo_path = Path(git_repo_with_commits.working_dir)
+        data_dir = temp_dir / "data"
+
+        scanner = ProjectScanner([], [], data_dir=data_dir)
+        git_info = scanner._get_git_info(repo_path, 1000)
+        scanner.flush_git_cache()
+        assert (data_dir / "git_cache.json").exists()
+
+        reloaded = ProjectScanner([], [], data_dir=data_dir)
+        with patch.object(reloaded, "_read_git_info", return_value={"branch": "other"}) as read:
+            assert reloaded._get_git_info(repo_path, 1000) == git_info
+            read.assert_not_called()
+
+            # Newer worktree files invalidate the entry
+            assert reloaded._get_git_info(repo_path, 2000) == {"branch": "other"}
+            read.assert_called_once()
+
+    @pytest.mark.unit
+    @pytest.mark.git
+    def test_git_info_cache_notices_deleted_files(self, git_repo_with_commits):
+        """Test deleting a tracked file invalidates cached git info."""
+        repo_path = Path(git_repo_with_commits.working_dir)
+        scanner = ProjectScanner([], [".git"])
+
+        assert scanner._analyze_directory(repo_path)["git"]["is_dirty"] is False
+
+        (repo_path / "file_0.txt").unlink()
+
+        assert scanner._analyze_directory(repo_path)["git"]["is_dirty"] is True
+
     @pytest.mark.unit
     def test_git_info_with_non_git_directory(self, temp_dir):
         """Test git info returns None for non-git directories."""
@@ -348,13 +416,13 @@ class TestErrorHandling:
         restricted_dir = temp_dir / "restricted"
         restricted_dir.mkdir()
 
-        def mock_iterdir_error(*args, **kwargs):
+        def mock_scandir_error(*args, **kwargs):
             raise PermissionError("Permission denied")
 
         scanner = ProjectScanner([str(temp_dir)], [])
 
         with monkeypatch.context() as m:
-            m.setattr(Path, "iterdir", mock_iterdir_error)
+            m.setattr(os, "scandir", mock_scandir_error)
             projects = scanner.scan_projects()
 
         # Should handle error and return empty list
@@ -367,13 +435,13 @@ class TestErrorHandling:
         project_dir.mkdir()
         (project_dir / "setup.py").touch()
 
-        def mock_exists_error(*args, **kwargs):
+        def mock_scandir_error(*args, **kwargs):
             raise OSError("Disk error")
 
         scanner = ProjectScanner([], [])
 
         with monkeypatch.context() as m:
-            m.setattr(Path, "exists", mock_exists_error)
+            m.setattr(os, "scandir", mock_scandir_error)
             result = scanner._analyze_directory(project_dir)
 
         assert result is None